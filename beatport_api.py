@@ -1,7 +1,77 @@
-from datetime import timedelta, datetime
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import MappingProxyType
+from urllib.parse import parse_qs, urlsplit
+
+from requests.adapters import HTTPAdapter
 
 from utils.utils import create_requests_session
 
+log = logging.getLogger(__name__)
+
+_API_URL = 'https://api.beatport.com/v4/'
+_AUTHORIZE_URL = _API_URL + 'auth/o/authorize/'
+_LOGIN_URL = _API_URL + 'auth/login/'
+_TOKEN_URL = _API_URL + 'auth/o/token/'
+_INTROSPECT_URL = _API_URL + 'auth/o/introspect'
+_CATALOG_URL = _API_URL + 'catalog/'
+
+# catalog metadata (tracks, releases, ...) is cached per BeatportApi instance
+_CATALOG_CACHE_SIZE = 2048
+_CATALOG_CACHE_TTL = 300  # seconds
+
+try:
+    # optional, considerably faster for the large paginated catalog responses
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_NEXT_DATA_RE = re.compile(rb'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>', re.DOTALL)
+
+_BLANK_RE = re.compile(r'blank', re.IGNORECASE)
+
+# EXTREMELY conservative territory checking - only raise region locked if VERY EXPLICITLY about territory/region restrictions
+# The API might return 403 for many reasons (subscription, account issues, etc.) - don't assume region lock
+# Since tracks can be available on the website but API returns 403, we should be VERY careful
+_EXPLICIT_REGION_PHRASES = (
+    "not available in your territory",
+    "not available in your region",
+    "not available in this territory",
+    "not available in this region",
+    "territory not allowed",
+    "region not allowed",
+    "geographic restrictions apply",
+    "territorial restrictions apply",
+    "this content is not available in your territory",
+    "this content is not available in your region"
+)
+
+# one alternation for all phrases, matched as complete phrases with word boundaries
+# Don't match partial phrases like just "territory" or "region"
+_REGION_RE = re.compile(r'\b(?:' + '|'.join(re.escape(phrase) for phrase in _EXPLICIT_REGION_PHRASES) + r')\b')
+
+# read-only, headers() hands it out to every caller
+_DEFAULT_HEADERS = MappingProxyType({
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
+    'referer': 'https://www.beatport.com/',
+    'origin': 'https://www.beatport.com'
+})
+
+
+def _response_json(r) -> dict:
+    # parse the raw body directly, requests' own decoding is only needed for odd encodings
+    try:
+        return _loads(r.content)
+    except ValueError:
+        return r.json()
+
 
 class BeatportError(Exception):
     def __init__(self, message):
@@ -10,53 +80,83 @@ class BeatportError(Exception):
 
 
 class BeatportApi:
-    def __init__(self):
-        self.API_URL = "https://api.beatport.com/v4/"
+    API_URL = _API_URL
 
+    __slots__ = ('client_id', 'redirect_uri', 'access_token', 'refresh_token', 'expires', '_expires_at',
+                 'refresh_lock', 'on_refresh', 'on_unauthorized', '_catalog_cache', '_catalog_inflight', '_catalog_lock', '_headers', 's')
+
+    def __init__(self):
         # client id from Serato DJ Lite
         self.client_id = "Zy2K9Wvy6DkUds7g8s1GNMHfk17E5Ch2BWHlyaGY"
         self.redirect_uri = "seratodjlite://beatport"
 
         self.access_token = None
         self.refresh_token = None
+        # epoch timestamp (time.time()) of the access_token expiry, stored in the session
         self.expires = None
+        # time.monotonic() deadline of the access_token, unlike expires it is immune to wall clock changes
+        self._expires_at = None
+        # only one thread at a time may refresh, the refresh_token is rotated on every refresh; shared with the
+        # module interface (re-login after a failed refresh), reentrant as a re-login makes API calls itself
+        self.refresh_lock = threading.RLock()
+        # called (holding refresh_lock) after every successful refresh, to store the new session
+        self.on_refresh = None
+        # called on every 401 response, before the refresh
+        self.on_unauthorized = None
+
+        # url -> (monotonic timestamp, response) in least recently used order, see _get_cached()
+        self._catalog_cache = OrderedDict()
+        # url -> Event set once the running fetch of that url is done, concurrent misses wait instead of fetching too
+        self._catalog_inflight = {}
+        # the cache is shared by the prefetch and pagination threads
+        self._catalog_lock = threading.Lock()
+
+        # (access_token, headers) of the cached API headers, a single attribute so the pair is always consistent
+        # across threads, see headers()
+        self._headers = (None, None)
 
         # required for the cookies
         self.s = create_requests_session()
 
+        # larger keep-alive pool for the Beatport hosts, the module fetches pages and durations from several threads
+        # keep the retry policy of the default session
+        max_retries = self.s.get_adapter('https://').max_retries
+        for prefix in ('https://api.beatport.com/', 'https://www.beatport.com/'):
+            self.s.mount(prefix, HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=max_retries))
+
     def get_anonymous_token(self):
-        import re
-        import json
         r = self.s.get("https://www.beatport.com/", headers={
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36"
         })
         if r.status_code != 200:
             raise ConnectionError(f"Failed to get Beatport homepage ({r.status_code})")
 
-        match = re.search(r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>', r.text, flags=re.DOTALL)
+        # search the raw bytes, only the matched JSON blob needs to be decoded
+        match = _NEXT_DATA_RE.search(r.content)
         if not match:
             raise BeatportError("Could not find __NEXT_DATA__ on Beatport homepage")
 
-        data = json.loads(match.group(1))
-
-        def find_anon_session(obj):
-            if isinstance(obj, dict):
-                # Target the specific 'anonSession' object if possible
-                if 'anonSession' in obj and isinstance(obj['anonSession'], dict):
-                    if 'access_token' in obj['anonSession']:
-                        return obj['anonSession']
-                
-                # Check for access_token in the current level as well
-                if 'access_token' in obj:
-                    return obj
-                    
-                for k, v in obj.items():
-                    res = find_anon_session(v)
-                    if res: return res
-            elif isinstance(obj, list):
-                for item in obj:
-                    res = find_anon_session(item)
-                    if res: return res
+        data = _loads(match.group(1))
+
+        def find_anon_session(root):
+            # iterative depth-first walk, avoids a Python frame per node of the (large) __NEXT_DATA__ payload
+            stack = [root]
+            while stack:
+                obj = stack.pop()
+                if isinstance(obj, dict):
+                    # Target the specific 'anonSession' object if possible
+                    anon_session = obj.get('anonSession')
+                    if isinstance(anon_session, dict) and 'access_token' in anon_session:
+                        return anon_session
+
+                    # Check for access_token in the current level as well
+                    if 'access_token' in obj:
+                        return obj
+
+                    # reversed, so children are visited in the same order as before
+                    stack.extend(reversed(obj.values()))
+                elif isinstance(obj, list):
+                    stack.extend(reversed(obj))
             return None
 
         token_data = find_anon_session(data)
@@ -65,16 +165,25 @@ class BeatportApi:
 
         self.access_token = token_data['access_token']
         self.refresh_token = None
-        expires_in = token_data.get('expires_in', 3600)
-        self.expires = datetime.now() + timedelta(seconds=expires_in)
+        self._set_expires(token_data.get('expires_in', 3600))
+
+    def _set_expires(self, expires_in: int):
+        # expires is stored in the session (across runs) so it has to be a wall clock timestamp
+        self.expires = time.time() + expires_in
+        self._expires_at = time.monotonic() + expires_in
 
     def headers(self, use_access_token: bool = False):
-        return {
-            'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
-            'authorization': f'Bearer {self.access_token}' if use_access_token else None,
-            'referer': 'https://www.beatport.com/',
-            'origin': 'https://www.beatport.com'
-        }
+        if not use_access_token:
+            return _DEFAULT_HEADERS
+
+        # only rebuild the headers when the access_token changed (login, refresh, anonymous token), read the token
+        # once, another thread may refresh it in the meantime
+        access_token = self.access_token
+        headers_token, headers = self._headers
+        if headers is None or headers_token != access_token:
+            headers = MappingProxyType({**_DEFAULT_HEADERS, 'authorization': f'Bearer {access_token}'})
+            self._headers = (access_token, headers)
+        return headers
 
     def auth(self, username: str, password: str) -> dict:
         acc_headers = {
@@ -83,7 +192,7 @@ class BeatportApi:
         }
 
         # authorize the code_challenge
-        r = self.s.get(f"{self.API_URL}auth/o/authorize/", params={
+        r = self.s.get(_AUTHORIZE_URL, params={
             "client_id": self.client_id,
             "response_type": "code",
             "redirect_uri": self.redirect_uri,
@@ -96,7 +205,7 @@ class BeatportApi:
         base_url = r.request.url.replace(r.request.path_url, '')
         referer = base_url + r.headers['location']
 
-        r = self.s.post(f"{self.API_URL}auth/login/", json={
+        r = self.s.post(_LOGIN_URL, json={
             "username": username,
             "password": password,
         }, headers={**acc_headers, "Referer": referer})
@@ -104,13 +213,13 @@ class BeatportApi:
         if r.status_code != 200:
             # Check for blank field errors and provide a better message
             try:
-                error_data = r.json()
+                error_data = _response_json(r)
                 if isinstance(error_data, dict):
                     if "username" in error_data and "password" in error_data:
                         username_errors = error_data.get("username", [])
                         password_errors = error_data.get("password", [])
-                        if any("blank" in str(msg).lower() for msg in username_errors) and \
-                           any("blank" in str(msg).lower() for msg in password_errors):
+                        if any(_BLANK_RE.search(msg) for msg in username_errors if isinstance(msg, str)) and \
+                           any(_BLANK_RE.search(msg) for msg in password_errors if isinstance(msg, str)):
                             raise BeatportError(
                                 "Beatport credentials are missing in settings.json. "
                                 "Please fill in: username, password. "
@@ -121,7 +230,7 @@ class BeatportApi:
             raise ConnectionError(r.text)
 
         # get the code from the redirect url, that's why redirect is disabled
-        r = self.s.get(f"{self.API_URL}auth/o/authorize/", params={
+        r = self.s.get(_AUTHORIZE_URL, params={
             "client_id": self.client_id,
             "response_type": "code",
             "redirect_uri": self.redirect_uri,
@@ -131,10 +240,10 @@ class BeatportApi:
             raise ConnectionError(r.text)
 
         # get the code from the redirect url
-        code = r.headers['location'].split('code=')[1]
+        code = parse_qs(urlsplit(r.headers['location']).query)['code'][0]
 
         # exchange the code for the access_token, refresh_token and expires_in
-        r = self.s.post(f"{self.API_URL}auth/o/token/", data={
+        r = self.s.post(_TOKEN_URL, data={
             "client_id": self.client_id,
             "code": code,
             "grant_type": "authorization_code",
@@ -145,33 +254,44 @@ class BeatportApi:
             raise ConnectionError(r.text)
 
         # convert to JSON
-        r = r.json()
+        r = _response_json(r)
 
         # save all tokens with access_token expiry date
         self.access_token = r['access_token']
         self.refresh_token = r['refresh_token']
-        self.expires = datetime.now() + timedelta(seconds=r['expires_in'])
+        self._set_expires(r['expires_in'])
 
         return r
 
     def refresh(self):
-        r = self.s.post(f'{self.API_URL}auth/o/token/', data={
+        r = self.s.post(_TOKEN_URL, data={
             'client_id': self.client_id,
             'refresh_token': self.refresh_token,
             'grant_type': 'refresh_token',
         })
 
         if r.status_code != 200:
-            return r.json()
+            return _response_json(r)
 
-        self.access_token = r.json()['access_token']
-        self.refresh_token = r.json()['refresh_token']
-        self.expires = datetime.now() + timedelta(seconds=r.json()['expires_in'])
+        # convert to JSON once
+        r = _response_json(r)
+
+        self.access_token = r['access_token']
+        self.refresh_token = r['refresh_token']
+        self._set_expires(r['expires_in'])
 
     def set_session(self, session: dict):
         self.access_token = session.get('access_token')
         self.refresh_token = session.get('refresh_token')
         self.expires = session.get('expires')
+        # sessions stored by older versions have a datetime expiry date
+        if isinstance(self.expires, datetime):
+            self.expires = self.expires.timestamp()
+
+        # convert the stored wall clock expiry timestamp to a monotonic deadline
+        self._expires_at = None
+        if self.expires is not None:
+            self._expires_at = time.monotonic() + (self.expires - time.time())
 
     def get_session(self):
         return {
@@ -180,208 +300,317 @@ class BeatportApi:
             'expires': self.expires
         }
 
-    def _get(self, endpoint: str, params: dict = None):
-        # function for API requests
+    def is_expired(self, grace: int = 0) -> bool:
+        # an unknown expiry counts as expired, grace seconds before the expiry count as expired already
+        return self.expires is None or time.time() >= self.expires - grace
+
+    def expires_soon(self, grace: int = 30) -> bool:
+        # True if the access_token expires within the next grace seconds
+        return self._expires_at is not None and time.monotonic() >= self._expires_at - grace
+
+    def refresh_if_stale(self, access_token: str):
+        # refresh the given access_token, unless another thread already replaced it while this one was waiting for
+        # the lock; returns the error response of a failed refresh like refresh()
+        with self.refresh_lock:
+            if self.access_token != access_token:
+                return None
+
+            if not self.refresh_token:
+                self.get_anonymous_token()
+            else:
+                error = self.refresh()
+                if error:
+                    return error
+
+            if self.on_refresh is not None:
+                self.on_refresh()
+        return None
+
+    def _ensure_fresh_token(self, grace: int = 30):
+        # refresh the access_token shortly before it expires instead of waiting for the 401 and a retry
+        if not self.expires_soon(grace):
+            return
+
+        with self.refresh_lock:
+            # another thread could have refreshed it in the meantime
+            if not self.expires_soon(grace):
+                return
+
+            if self.refresh_if_stale(self.access_token):
+                # don't retry on every request, leave it to the 401 handling in _get() to report the failed refresh
+                log.debug("Beatport: proactive token refresh failed")
+                self._expires_at = None
+
+    def _get(self, url: str, params: dict = None):
+        # function for API requests, url is the full endpoint URL (see the module URL constants)
         if not params:
             params = {}
 
-        r = self.s.get(f'{self.API_URL}{endpoint}', params=params, headers=self.headers(use_access_token=True))
+        self._ensure_fresh_token()
+
+        access_token = self.access_token
+        headers = self.headers(use_access_token=True)
+        r = self.s.get(url, params=params, headers=headers)
 
         # access_token expired or invalid
         if r.status_code == 401:
-            if not self.refresh_token:
-                # Forced refresh for anonymous sessions
-                self.get_anonymous_token()
-            else:
-                err = self.refresh()
-                if err:
-                    raise ValueError(f"Refresh failed: {r.text}")
+            if self.on_unauthorized is not None:
+                self.on_unauthorized()
+            # concurrent requests run into the same 401, only the first one refreshes (or gets a new anonymous token)
+            if self.refresh_if_stale(access_token):
+                raise ValueError(f"Refresh failed: {r.text}")
             
-            # retry request
-            r = self.s.get(f'{self.API_URL}{endpoint}', params=params, headers=self.headers(use_access_token=True))
+            # retry request, only now the headers need the new access_token
+            headers = self.headers(use_access_token=True)
+            r = self.s.get(url, params=params, headers=headers)
 
             if r.status_code == 401:
-                import logging
-                logging.error(f"Beatport API Authentication failed after retry for endpoint: {endpoint}")
-                logging.error(f"  Response: {r.text[:500]}")
+                log.error("Beatport API Authentication failed after retry for endpoint: %s", url)
+                log.error("  Response: %s", r.text[:500])
                 raise ValueError(f"Authentication failed after retry: {r.text}")
 
-        # check if territory is not allowed or other access issues
+        if r.status_code not in {200, 201, 202}:
+            self._handle_error(r, url)
+
+        return _response_json(r)
+
+    @staticmethod
+    def _handle_error(r, endpoint: str):
+        # raises the matching error for an unsuccessful API response, the body is only parsed once
+        if r.status_code not in {403, 404}:
+            raise ConnectionError(r.text)
+
+        try:
+            response_data = _response_json(r)
+        except ValueError:
+            # If we can't parse JSON, log the raw response and give a generic error
+            log.warning("Beatport API %s error - could not parse JSON response: %s", r.status_code, r.text[:500])
+            if r.status_code == 404:
+                raise BeatportError("not found (HTTP 404)")
+            raise BeatportError(f"API error (HTTP 403): {r.text[:200] if r.text else 'Unable to parse error response'}")
+
+        detail = response_data.get("detail", "")
+        error_message = response_data.get("error", "")
+        message = response_data.get("message", "")
+
+        # Log the full response for debugging
+        log.warning("Beatport API %s error - endpoint: %s", r.status_code, endpoint)
+        log.warning("  detail: %s", detail)
         if r.status_code == 403:
-            try:
-                response_data = r.json()
-                detail = response_data.get("detail", "")
-                error_code = response_data.get("error_code", "")
-                error_message = response_data.get("error", "")
-                message = response_data.get("message", "")
-                
-                import logging
-                logging.warning(f"Beatport API 403 error - endpoint: {endpoint}")
-                logging.warning(f"  detail: {detail}")
-                logging.warning(f"  error_code: {error_code}")
-                logging.warning(f"  error: {error_message}")
-                logging.warning(f"  message: {message}")
-                logging.warning(f"  full_response: {response_data}")
-                
-                # Collect all error text fields
-                all_error_text = " ".join(filter(None, [detail, error_message, message]))
-                all_error_text_lower = all_error_text.lower()
-                
-                # EXTREMELY conservative territory checking - only raise region locked if VERY EXPLICITLY about territory/region restrictions
-                # The API might return 403 for many reasons (subscription, account issues, etc.) - don't assume region lock
-                # Since tracks can be available on the website but API returns 403, we should be VERY careful
-                explicit_region_phrases = [
-                    "not available in your territory",
-                    "not available in your region", 
-                    "not available in this territory",
-                    "not available in this region",
-                    "territory not allowed",
-                    "region not allowed",
-                    "geographic restrictions apply",
-                    "territorial restrictions apply",
-                    "this content is not available in your territory",
-                    "this content is not available in your region"
-                ]
-                
-                # Check if any explicit region phrase appears - must be very explicit and complete
-                # Don't match partial phrases like just "territory" or "region"
-                is_region_locked = False
-                if all_error_text_lower:
-                    import re
-                    for phrase in explicit_region_phrases:
-                        # Check if phrase appears as a complete phrase with word boundaries
-                        pattern = r'\b' + re.escape(phrase) + r'\b'
-                        if re.search(pattern, all_error_text_lower):
-                            is_region_locked = True
-                            logging.warning(f"  Detected explicit region lock phrase: {phrase}")
-                            break
-                    
-                    # Also check for "territory restricted" or "region restricted" but only if they appear as complete phrases
-                    if not is_region_locked:
-                        if re.search(r'\bterritory\s+restricted\b', all_error_text_lower) or \
-                           re.search(r'\bregion\s+restricted\b', all_error_text_lower):
-                            is_region_locked = True
-                            logging.warning(f"  Detected explicit region lock: territory/region restricted")
-                
-                if is_region_locked:
-                    # Log which phrase was detected
-                    import sys
-                    print(f"[DEBUG] Raising 'region locked' based on detected phrase", file=sys.stderr)
-                    raise BeatportError("region locked")
-                elif "subscription" in all_error_text_lower:
-                    raise BeatportError("subscription required")
-                elif "not available" in all_error_text_lower and ("download" in all_error_text_lower or "stream" in all_error_text_lower):
-                    raise BeatportError("content not available")
-                else:
-                    # Log that we're NOT treating this as region locked
-                    import sys
-                    print(f"[DEBUG] NOT treating as region locked - no explicit region phrases found", file=sys.stderr)
-                    print(f"[DEBUG] All error text: {all_error_text}", file=sys.stderr)
-                    # For other 403 errors, show the actual error message from API
-                    # This is likely NOT a region lock - could be subscription, account issue, or API problem
-                    error_msg = detail if detail else (error_message if error_message else (message if message else "access denied (HTTP 403)"))
-                    # Don't label it as region locked - show the actual API error
-                    raise BeatportError(f"API error: {error_msg}")
-            except BeatportError:
-                # Re-raise BeatportError as-is
-                raise
-            except (ValueError, KeyError) as e:
-                # If we can't parse JSON, log the raw response and give a generic 403 error
-                import logging
-                logging.warning(f"Beatport API 403 error - could not parse JSON response: {r.text[:500]}")
-                raise BeatportError(f"API error (HTTP 403): {r.text[:200] if r.text else 'Unable to parse error response'}")
-        
+            log.warning("  error_code: %s", response_data.get("error_code", ""))
+        log.warning("  error: %s", error_message)
+        log.warning("  message: %s", message)
+        log.warning("  full_response: %s", response_data)
+
         # Check for 404 errors (not found)
         if r.status_code == 404:
+            # Return a clear "not found" error
+            error_msg = detail if detail else (error_message if error_message else (message if message else "not found"))
+            raise BeatportError(f"not found: {error_msg}")
+
+        # check if territory is not allowed or other access issues
+        # Collect all error text fields
+        all_error_text = " ".join(filter(None, (detail, error_message, message)))
+        all_error_text_lower = all_error_text.lower()
+
+        # Check if any explicit region phrase appears - must be very explicit and complete
+        is_region_locked = False
+        # cheap substring prefilter, most 403s (subscription, account) never mention a territory or region
+        if 'territ' in all_error_text_lower or 'region' in all_error_text_lower or \
+                'geograph' in all_error_text_lower:
+            region_match = _REGION_RE.search(all_error_text_lower)
+            if region_match:
+                is_region_locked = True
+                log.warning("  Detected explicit region lock phrase: %s", region_match.group(0))
+            else:
+                # Also check for "territory restricted" or "region restricted", with the whitespace collapsed
+                normalized_error_text = " ".join(all_error_text_lower.split())
+                if "territory restricted" in normalized_error_text or "region restricted" in normalized_error_text:
+                    is_region_locked = True
+                    log.warning("  Detected explicit region lock: territory/region restricted")
+
+        if is_region_locked:
+            # Log which phrase was detected
+            log.debug("Raising 'region locked' based on detected phrase")
+            raise BeatportError("region locked")
+        elif "subscription" in all_error_text_lower:
+            raise BeatportError("subscription required")
+        elif "not available" in all_error_text_lower and ("download" in all_error_text_lower or "stream" in all_error_text_lower):
+            raise BeatportError("content not available")
+
+        # Log that we're NOT treating this as region locked
+        log.debug("NOT treating as region locked - no explicit region phrases found")
+        log.debug("All error text: %s", all_error_text)
+        # For other 403 errors, show the actual error message from API
+        # This is likely NOT a region lock - could be subscription, account issue, or API problem
+        error_msg = detail if detail else (error_message if error_message else (message if message else "access denied (HTTP 403)"))
+        # Don't label it as region locked - show the actual API error
+        raise BeatportError(f"API error: {error_msg}")
+
+    def _get_cached(self, url: str):
+        # memoized _get() for the idempotent catalog metadata endpoints
+        while True:
+            now = time.monotonic()
+            with self._catalog_lock:
+                cached = self._catalog_cache.get(url)
+                if cached is not None and now - cached[0] < _CATALOG_CACHE_TTL:
+                    self._catalog_cache.move_to_end(url)
+                    # shallow copy, callers are allowed to modify the returned dict
+                    return dict(cached[1])
+                event = self._catalog_inflight.get(url)
+                if event is None:
+                    event = self._catalog_inflight[url] = threading.Event()
+                    break
+            # another thread is fetching this url, wait for it and look again (fetch it here if that one failed)
+            event.wait()
+
+        try:
+            data = self._get(url)
+            with self._catalog_lock:
+                self._catalog_cache[url] = (now, data)
+                self._catalog_cache.move_to_end(url)
+                if len(self._catalog_cache) > _CATALOG_CACHE_SIZE:
+                    # evict the least recently used entry
+                    self._catalog_cache.popitem(last=False)
+        finally:
+            with self._catalog_lock:
+                del self._catalog_inflight[url]
+            event.set()
+        return dict(data)
+
+    def get_all_pages(self, page_getter, item_id: str, per_page: int = 100, max_workers: int = 8,
+                      first_page: dict = None, skip_failed: bool = False) -> dict:
+        # fetch the first page (unless already fetched) to get the total "count",
+        # then fetch all remaining pages concurrently
+        # skip_failed: skip a page failing with an API or network error instead of raising, only for listings where
+        # a gap doesn't matter (not for releases, their track numbers are the position in the results)
+        if first_page is None:
+            first_page = page_getter(item_id, page=1, per_page=per_page)
+        results = list(first_page.get('results') or ())
+        total_items = first_page.get('count') or len(results)
+        num_pages = max(1, -(-total_items // per_page))
+
+        def fetch_page(page):
+            if not skip_failed:
+                return page_getter(item_id, page=page, per_page=per_page)
+
+            # a failed page is skipped instead of discarding all the pages fetched around it, authentication
+            # failures (ValueError) still raise
             try:
-                response_data = r.json()
-                detail = response_data.get("detail", "")
-                error_message = response_data.get("error", "")
-                message = response_data.get("message", "")
-                
-                # Log the full response for debugging
-                import logging
-                logging.warning(f"Beatport API 404 error - endpoint: {endpoint}")
-                logging.warning(f"  detail: {detail}")
-                logging.warning(f"  error: {error_message}")
-                logging.warning(f"  message: {message}")
-                logging.warning(f"  full_response: {response_data}")
-                
-                # Return a clear "not found" error
-                error_msg = detail if detail else (error_message if error_message else (message if message else "not found"))
-                raise BeatportError(f"not found: {error_msg}")
-            except BeatportError:
-                raise
-            except (ValueError, KeyError):
-                # If we can't parse JSON, just give a generic 404 error
-                import logging
-                logging.warning(f"Beatport API 404 error - could not parse JSON response: {r.text[:500]}")
-                raise BeatportError(f"not found (HTTP 404)")
+                return page_getter(item_id, page=page, per_page=per_page)
+            except (BeatportError, OSError) as e:
+                log.warning("Beatport: skipping page %s of %s after an error: %s", page, item_id, e)
+                return None
 
-        if r.status_code not in {200, 201, 202}:
-            raise ConnectionError(r.text)
+        if num_pages > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, num_pages - 1)) as executor:
+                # map() keeps the page order
+                for page_data in executor.map(fetch_page, range(2, num_pages + 1)):
+                    results.extend((page_data.get('results') if page_data else None) or ())
 
-        return r.json()
+        return {**first_page, 'results': results}
 
     def get_account(self):
-        return self._get('auth/o/introspect')
+        return self._get(_INTROSPECT_URL)
 
     def get_track(self, track_id: str):
-        return self._get(f'catalog/tracks/{track_id}')
+        return self._get_cached(f'{_CATALOG_URL}tracks/{track_id}')
+
+    def get_tracks_bulk(self, track_ids, per_page: int = 100) -> dict:
+        # fetch several tracks with the catalog "id" filter, per_page ids per request (concurrently),
+        # returns str(track_id) -> track for the tracks the API returned, callers fetch the rest one by one
+        track_ids = [str(track_id) for track_id in track_ids]
+        chunks = [track_ids[i:i + per_page] for i in range(0, len(track_ids), per_page)]
+        if not chunks:
+            return {}
+
+        def fetch(chunk):
+            # an API or network error only loses this chunk, authentication failures (ValueError) still raise
+            try:
+                return self._get(f'{_CATALOG_URL}tracks/', params={'id': ','.join(chunk), 'per_page': per_page})
+            except (BeatportError, OSError) as e:
+                log.debug("Beatport: bulk track fetch failed: %s", e)
+                return None
+
+        wanted = set(track_ids)
+        tracks = {}
+        with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as executor:
+            for data in executor.map(fetch, chunks):
+                for track in (data.get('results') if data else None) or ():
+                    # only keep what was asked for, in case the filter is not applied
+                    if str(track.get('id')) in wanted:
+                        tracks[str(track['id'])] = track
+        return tracks
 
     def get_release(self, release_id: str):
-        return self._get(f'catalog/releases/{release_id}')
+        return self._get_cached(f'{_CATALOG_URL}releases/{release_id}')
+
+    def get_releases_bulk(self, release_ids, max_workers: int = 8) -> dict:
+        # fetch several releases concurrently, returns release_id -> release without the ones that failed with an
+        # API or network error (not found, region locked, ...), authentication failures (ValueError) still raise
+        def fetch(release_id):
+            try:
+                return release_id, self.get_release(release_id)
+            except (BeatportError, OSError) as e:
+                log.debug("Beatport: bulk release fetch of %s failed: %s", release_id, e)
+                return release_id, None
+
+        release_ids = list(release_ids)
+        if not release_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(release_ids))) as executor:
+            return {release_id: release for release_id, release in executor.map(fetch, release_ids) if release}
 
     def get_release_tracks(self, release_id: str, page: int = 1, per_page: int = 100):
-        return self._get(f'catalog/releases/{release_id}/tracks', params={
+        return self._get(f'{_CATALOG_URL}releases/{release_id}/tracks', params={
             'page': page,
             'per_page': per_page
         })
 
     def get_playlist(self, playlist_id: str):
-        return self._get(f'catalog/playlists/{playlist_id}')
+        return self._get_cached(f'{_CATALOG_URL}playlists/{playlist_id}')
 
     def get_playlist_tracks(self, playlist_id: str, page: int = 1, per_page: int = 100):
-        return self._get(f'catalog/playlists/{playlist_id}/tracks', params={
+        return self._get(f'{_CATALOG_URL}playlists/{playlist_id}/tracks', params={
             'page': page,
             'per_page': per_page
         })
 
     def get_chart(self, chart_id: str):
-        return self._get(f'catalog/charts/{chart_id}')
+        return self._get_cached(f'{_CATALOG_URL}charts/{chart_id}')
 
     def get_chart_tracks(self, chart_id: str, page: int = 1, per_page: int = 100):
-        return self._get(f'catalog/charts/{chart_id}/tracks', params={
+        return self._get(f'{_CATALOG_URL}charts/{chart_id}/tracks', params={
             'page': page,
             'per_page': per_page
         })
 
     def get_artist(self, artist_id: str):
-        return self._get(f'catalog/artists/{artist_id}')
+        return self._get_cached(f'{_CATALOG_URL}artists/{artist_id}')
 
     def get_artist_tracks(self, artist_id: str, page: int = 1, per_page: int = 100):
-        return self._get(f'catalog/artists/{artist_id}/tracks', params={
+        return self._get(f'{_CATALOG_URL}artists/{artist_id}/tracks', params={
             'page': page,
             'per_page': per_page
         })
 
     def get_artist_releases(self, artist_id: str, page: int = 1, per_page: int = 100):
-        return self._get(f'catalog/artists/{artist_id}/releases', params={
+        return self._get(f'{_CATALOG_URL}artists/{artist_id}/releases', params={
             'page': page,
             'per_page': per_page
         })
 
     def get_label(self, label_id: str):
-        return self._get(f'catalog/labels/{label_id}')
+        return self._get_cached(f'{_CATALOG_URL}labels/{label_id}')
 
     def get_label_releases(self, label_id: str, page: int = 1, per_page: int = 100):
-        return self._get(f'catalog/labels/{label_id}/releases', params={
+        return self._get(f'{_CATALOG_URL}labels/{label_id}/releases', params={
             'page': page,
             'per_page': per_page
         })
 
     def get_label_tracks(self, label_id: str, page: int = 1, per_page: int = 100):
-        return self._get(f'catalog/labels/{label_id}/tracks', params={
+        return self._get(f'{_CATALOG_URL}labels/{label_id}/tracks', params={
             'page': page,
             'per_page': per_page
         })
@@ -394,12 +623,12 @@ class BeatportApi:
             params['page'] = page
             params['per_page'] = per_page
         # else (no search_type), the API returns a multi-category summary without pagination
-        return self._get('catalog/search', params=params)
+        return self._get(f'{_CATALOG_URL}search', params=params)
 
     def get_track_stream(self, track_id: str):
         # get the 128k stream (.m3u8) for a given track id from needledrop.beatport.com
-        return self._get(f'catalog/tracks/{track_id}/stream')
+        return self._get(f'{_CATALOG_URL}tracks/{track_id}/stream')
 
     def get_track_download(self, track_id: str, quality: str):
         # get the 256k stream (.mp4) for a given track id
-        return self._get(f'catalog/tracks/{track_id}/download', params={'quality': quality})
\ No newline at end of file
+        return self._get(f'{_CATALOG_URL}tracks/{track_id}/download', params={'quality': quality})
\ No newline at end of file
@@ -1,8 +1,11 @@
+import concurrent.futures
 import logging
 import re
+import time
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
-
-from datetime import datetime
+from urllib.parse import urlsplit
 
 from utils.models import *
 from utils.models import AlbumInfo
@@ -12,13 +15,244 @@ module_information = ModuleInformation(
     service_name="Beatport",
     module_supported_modes=ModuleModes.download | ModuleModes.covers,
     login_behaviour=ManualEnum.manual,
-    session_settings={"username": "", "password": ""},
-    session_storage_variables=["access_token", "refresh_token", "expires"],
+    session_settings={"username": "", "password": "", "validate_download_url": False},
+    session_storage_variables=["access_token", "refresh_token", "expires", "subscription", "subscription_checked_at"],
     netlocation_constant="beatport",
     url_decoding=ManualEnum.manual,
     test_url="https://www.beatport.com/track/darkside/10844269"
 )
 
+# hosts custom_url_parse() accepts links from
+_BEATPORT_HOSTS = frozenset(("beatport.com", "www.beatport.com"))
+# hardcoded cover resolution inside an image URL
+_RES_RE = re.compile(r"\d{3,4}x\d{3,4}")
+# content types _validate_download_url() accepts as audio (a substring match anywhere in the header)
+_AUDIO_CONTENT_TYPE_RE = re.compile(r"audio|octet-stream|mpeg|flac|application|video|mp4", re.IGNORECASE)
+
+# max items per page the Beatport API allows, every paginated call requests full pages
+_PAGE_SIZE = 100
+
+# min. seconds between two pagination progress lines
+_PROGRESS_INTERVAL = 0.5
+
+# temporary settings holding the BeatportApi session, see _load_session() and _save_session()
+_SESSION_KEYS = ("access_token", "refresh_token", "expires")
+
+# a failed valid_account() with one of these in its message is fixed by logging in again
+_SUBSCRIPTION_ERROR_TOKENS = ("subscription", "link")
+
+# the known get_track() error phrases in a single pass, the matches are looked up in _TRACK_ERRORS
+_TRACK_ERROR_RE = re.compile(r"not found|no track matches|region locked|subscription required|content not available|"
+                             r"access denied|api error", re.IGNORECASE)
+_TRACK_NOT_FOUND_ERROR = ("Track not found in API: {error}. The track ID from the URL ({track_id}) might not match "
+                          "the API track ID. Try using the release URL instead.")
+# for access denied or API errors, show the full message for debugging
+_TRACK_API_ERROR = ("API error: {error}. This might be a temporary API issue. Try again later or check your "
+                    "subscription status.")
+# matched error -> the message shown for the track, {error} is the original message and {track_id} the track
+# in order of priority, the first one found in the message wins
+_TRACK_ERRORS = MappingProxyType({
+    "not found": _TRACK_NOT_FOUND_ERROR,
+    "no track matches": _TRACK_NOT_FOUND_ERROR,
+    "region locked": "Track is not available in your region. Original error: {error}",
+    "subscription required": "Track requires a higher subscription level",
+    "content not available": "Track is not available for download",
+    "access denied": _TRACK_API_ERROR,
+    "api error": _TRACK_API_ERROR,
+})
+
+# temporary settings holding the subscription of the last valid_account(), see _load_account_data()
+_SUBSCRIPTION_KEYS = ("subscription", "subscription_checked_at")
+# seconds a stored subscription check stays valid across runs, see valid_account()
+_SUBSCRIPTION_CACHE_TTL = 3600
+
+# parse the URL "type" to the actual DownloadTypeEnum
+_MEDIA_TYPES = {
+    "track": DownloadTypeEnum.track,
+    "release": DownloadTypeEnum.album,
+    "artist": DownloadTypeEnum.artist,
+    "playlists": DownloadTypeEnum.playlist,
+    "chart": DownloadTypeEnum.playlist,
+    "label": DownloadTypeEnum.label
+}
+
+
+def _parse_url(link: str):
+    # split a Beatport URL into (region, type, id) in a single pass over its path segments, None if it isn't one
+    # /[region/]{type}/{slug}/{id} or /[region/]library/playlists/{id} (library playlists don't have a slug)
+    try:
+        url = urlsplit(link.strip())
+    except ValueError:
+        return None
+    if url.scheme not in ("http", "https") or (url.hostname or "") not in _BEATPORT_HOSTS:
+        return None
+
+    parts = [p for p in url.path.split("/") if p]
+    region = None
+    if parts and len(parts[0]) == 2 and parts[0].isalpha() and parts[0].islower():
+        region = parts.pop(0)
+
+    if len(parts) < 3 or not parts[-1].isdigit():
+        return None
+    if parts[0] == "library":
+        return (region, parts[1], parts[2]) if parts[1] == "playlists" and len(parts) == 3 else None
+    if parts[0] not in _MEDIA_TYPES:
+        return None
+    return region, parts[0], parts[-1]
+
+
+# map query types to API search types
+_SEARCH_TYPES = {
+    DownloadTypeEnum.track: "tracks",
+    DownloadTypeEnum.album: "releases",
+    DownloadTypeEnum.playlist: "charts",
+    DownloadTypeEnum.artist: "artists",
+    DownloadTypeEnum.label: "labels"
+}
+
+# DownloadTypeEnum names to the result keys of the general (untyped) search
+_NAME_PARSE = {
+    "track": "tracks",
+    "album": "releases",
+    "playlist": "charts",  # Compatibility: result_list will additionally include 'playlists' in search()
+    "artist": "artists",
+    "label": "labels"
+}
+
+# shared empty default for "(x.get(key) or _EMPTY).get(...)" chains, never modified
+_EMPTY = {}
+
+# Beatport's default placeholder for artists - we want to replace this with a better one
+_BEATPORT_DEFAULT_PLACEHOLDER = "0dc61986-bccf-49d4-8fad-6b147ea8f327"
+_BEATPORT_PREFERRED_PLACEHOLDER = "https://geo-media.beatport.com/image_size/500x500/ab2d1d04-233d-4b08-8234-9782b34dcab8.jpg"
+
+# MINIMUM-MEDIUM = 128kbit/s AAC, HIGH = 256kbit/s AAC, LOSSLESS-HIFI = FLAC 44.1/16
+# every quality tier is "medium" unless the account has a Professional subscription
+# read-only, both are shared by all instances through self.quality_parse
+_QUALITY_PARSE = MappingProxyType({
+    QualityEnum.MINIMUM: "medium",
+    QualityEnum.LOW: "medium",
+    QualityEnum.MEDIUM: "medium",
+    QualityEnum.HIGH: "medium",
+    QualityEnum.LOSSLESS: "medium",
+    QualityEnum.HIFI: "medium",
+    QualityEnum.ATMOS: "medium"
+})
+_PRO_QUALITY_PARSE = MappingProxyType({
+    **_QUALITY_PARSE,
+    QualityEnum.HIGH: "high",
+    QualityEnum.LOSSLESS: "lossless",
+    QualityEnum.HIFI: "lossless"
+})
+
+# kbit/s per Beatport download quality
+_BITRATE = {
+    "lossless": 1411,
+    "high": 256,
+    "medium": 128,
+}
+# quality tier -> (Beatport quality, bitrate) of both quality mappings, used through self.quality_bitrate
+_QUALITY_BITRATE = MappingProxyType({tier: (quality, _BITRATE[quality]) for tier, quality in _QUALITY_PARSE.items()})
+_PRO_QUALITY_BITRATE = MappingProxyType({tier: (quality, _BITRATE[quality])
+                                         for tier, quality in _PRO_QUALITY_PARSE.items()})
+
+
+def _year(date) -> Optional[str]:
+    # the year of an ISO format date (e.g., "2023-04-01T15:00:00Z" or "2023-04-01"), None without a (valid) date
+    if not date:
+        return None
+    year = str(date)[:4]
+    return year if len(year) == 4 and year.isdigit() else None
+
+
+# search() result projections, each returns (name, artists, year, duration, additional) for one API search result
+# or None if the result should be skipped
+def _project_playlist(i: dict, name: str, publish_date, track_count, genres_data):
+    additional = []
+    # Artist parsing: the chart artist, the playlist owner or Beatport itself
+    artists = [(i.get('artist') or _EMPTY).get('name') or (i.get('person') or _EMPTY).get('owner_name') or "Beatport"]
+    # Year parsing
+    year = _year(publish_date or i.get("created_date"))
+    # Track count
+    if track_count is not None:
+        additional.append("1 track" if track_count == 1 else f"{track_count} tracks")
+    return name, artists, year, None, additional
+
+
+def _project_track(i: dict, name: str, publish_date, track_count, genres_data):
+    artists = [a.get("name") for a in i.get("artists") or ()]
+    year = _year(publish_date)
+    length_ms = i.get("length_ms")
+    bpm = i.get("bpm")
+    mix_name = i.get("mix_name")
+    additional = [f"{bpm} BPM"] if bpm else []
+    if mix_name and name:  # Add mix name to track name
+        name += f" ({mix_name})"
+    return name, artists, year, length_ms // 1000 if length_ms else None, additional
+
+
+def _project_album(i: dict, name: str, publish_date, track_count, genres_data):
+    artists = [a.get("name") for a in i.get("artists") or ()]
+    year = _year(publish_date)
+    catalog_number = i.get("catalog_number")
+    additional = []
+    if track_count is not None:
+        additional.append("1 track" if track_count == 1 else f"{track_count} tracks")
+    if catalog_number:
+        additional.append(f"Cat: {catalog_number}")
+    return name, artists, year, None, additional
+
+
+def _project_artist(i: dict, name: str, publish_date, track_count, genres_data):
+    additional = []
+    if genres_data:
+        genre_names = [g_name for g in genres_data if (g_name := g.get("name"))]
+        if genre_names:
+            additional.append(", ".join(genre_names))
+    return name, [name] if name else [], None, None, additional
+
+
+def _project_label(i: dict, name: str, publish_date, track_count, genres_data):
+    rc = i.get("releases_count") or i.get("release_count")
+    if rc == 0:
+        return None
+    # str(date) of a date/datetime object is ISO format as well
+    year = _year(i.get("founded") or i.get("created_at") or i.get("founded_date"))
+    additional = []
+    if genres_data:
+        genre_names = [g_name for g in genres_data if (g_name := g.get("name"))]
+        if genre_names:
+            additional.append(", ".join(genre_names))
+    if rc is not None:
+        additional.append("1 release" if rc == 1 else f"{rc} releases")
+    return name, [name] if name else [], year, None, additional
+
+
+_SEARCH_PROJECTORS = {
+    DownloadTypeEnum.playlist: _project_playlist,
+    DownloadTypeEnum.track: _project_track,
+    DownloadTypeEnum.album: _project_album,
+    DownloadTypeEnum.artist: _project_artist,
+    DownloadTypeEnum.label: _project_label
+}
+
+
+@lru_cache(maxsize=2048)
+def _artwork_url(cover_url: str, size: int, max_size: int):
+    # memoized, all tracks of a release and most search results share the same cover URL and size
+    # if more than max_size are requested, cap the size at max_size
+    if size > max_size:
+        size = max_size
+
+    # check if it"s a dynamic_uri, if not make it one by replacing the hardcoded resolution with dynamic one
+    # (a single pass, a URL without a resolution is returned unchanged)
+    if "{w}x{h}" not in cover_url:
+        cover_url = _RES_RE.sub("{w}x{h}", cover_url)
+
+    # replace the dynamic_uri h and w parameter with the wanted size (plain replaces, other braces stay untouched)
+    size = str(size)
+    return cover_url.replace("{w}", size).replace("{h}", size)
+
 
 class ModuleInterface:
     # noinspection PyTypeChecker
@@ -29,24 +263,28 @@ class ModuleInterface:
         self.print = module_controller.printer_controller.oprint
         self.module_controller = module_controller
         self.cover_size = module_controller.orpheus_options.default_cover_options.resolution
+        # the HEAD check of every stream URL costs an extra CDN round trip per track, only on request
+        self.validate_download_url = bool(module_controller.module_settings.get("validate_download_url", False))
 
-        # MINIMUM-MEDIUM = 128kbit/s AAC, HIGH = 256kbit/s AAC, LOSSLESS-HIFI = FLAC 44.1/16
-        self.quality_parse = {
-            QualityEnum.MINIMUM: "medium",
-            QualityEnum.LOW: "medium",
-            QualityEnum.MEDIUM: "medium",
-            QualityEnum.HIGH: "medium",
-            QualityEnum.LOSSLESS: "medium",
-            QualityEnum.HIFI: "medium",
-            QualityEnum.ATMOS: "medium"
-        }
+        # shared read-only mappings, valid_account() switches to the _PRO_ ones for Professional accounts
+        self.quality_parse = _QUALITY_PARSE
+        self.quality_bitrate = _QUALITY_BITRATE
 
         self.session = BeatportApi()
-        session = {
-            "access_token": module_controller.temporary_settings_controller.read("access_token"),
-            "refresh_token": module_controller.temporary_settings_controller.read("refresh_token"),
-            "expires": module_controller.temporary_settings_controller.read("expires")
-        }
+        # store every refreshed session, including the ones refreshed by BeatportApi itself during API calls
+        self.session.on_refresh = self._save_session
+        # a 401 may mean the account changed, don't trust the stored subscription any longer
+        self.session.on_unauthorized = self._clear_subscription_cache
+        # whether a subscription is stored in the temporary settings, None if unknown (stored by a previous run)
+        self._subscription_stored = None
+        # account (subscription) data of the logged in user, see valid_account()
+        self._account_data = None
+        # albums and tracks a warning was already printed/logged for in this run, every track of a restricted album
+        # runs into the same error
+        self._warned_ids = set()
+        session = self._load_session()
+        # the session as stored in the temporary settings, see _save_session()
+        self._saved_session = dict(session)
 
         self.session.set_session(session)
 
@@ -66,10 +304,12 @@ class ModuleInterface:
 
         if session["refresh_token"] is None:
             # old beatport version with cookies and no refresh token, trigger login manually
-            session = self.login(username, password)
+            # login() already checks the account with the fresh session
+            self.login(username, password)
+            return
 
-        if session["refresh_token"] is not None and datetime.now() > session["expires"]:
-            # access token expired, get new refresh token
+        if self.session.is_expired(grace=30):
+            # access token expired (or about to), get new refresh token
             self.refresh_login()
 
         try:
@@ -78,46 +318,73 @@ class ModuleInterface:
             # Subscription check failed (expired account, no Link, etc.).
             # Clear stored session and re-login with credentials - user may have new account.
             err_msg = str(e).lower()
-            if "subscription" in err_msg or "link" in err_msg:
-                self.module_controller.temporary_settings_controller.set("access_token", None)
-                self.module_controller.temporary_settings_controller.set("refresh_token", None)
-                self.module_controller.temporary_settings_controller.set("expires", None)
+            if any(token in err_msg for token in _SUBSCRIPTION_ERROR_TOKENS):
+                self._clear_session()
                 self.login(username, password)
             else:
                 raise
 
+    def _load_session(self) -> dict:
+        # read the stored access_token, refresh_token and expires in one go
+        read = self.module_controller.temporary_settings_controller.read
+        return {key: read(key) for key in _SESSION_KEYS}
+
     def _save_session(self) -> dict:
-        # save the new access_token, refresh_token and expires in the temporary settings
-        self.module_controller.temporary_settings_controller.set("access_token", self.session.access_token)
-        self.module_controller.temporary_settings_controller.set("refresh_token", self.session.refresh_token)
-        self.module_controller.temporary_settings_controller.set("expires", self.session.expires)
+        # save the new access_token, refresh_token and expires in the temporary settings, skip unchanged values
+        session = self.session.get_session()
+        for key, value in session.items():
+            if self._saved_session.get(key) != value:
+                self.module_controller.temporary_settings_controller.set(key, value)
+        self._saved_session = dict(session)
+
+        return session
+
+    def _clear_session(self):
+        # remove the stored access_token, refresh_token and expires, only writes the ones that are still set
+        for key, value in self._saved_session.items():
+            if value is not None:
+                self.module_controller.temporary_settings_controller.set(key, None)
+                self._saved_session[key] = None
+        self._clear_subscription_cache()
+
+    def _clear_subscription_cache(self):
+        # remove the subscription stored by _load_account_data(), the next check asks the API again; runs on
+        # every 401 from any thread, so only write while something is stored (under the lock the session is saved)
+        with self.session.refresh_lock:
+            if self._subscription_stored is False:
+                return
+            for key in _SUBSCRIPTION_KEYS:
+                self.module_controller.temporary_settings_controller.set(key, None)
+            self._subscription_stored = False
+
+    def _ensure_fresh_token(self):
+        # refresh (and save) the access_token before a burst of API calls, instead of running into a 401 mid-pagination
+        if not self.session.expires_soon(60):
+            return
 
-        return {
-            "access_token": self.session.access_token,
-            "refresh_token": self.session.refresh_token,
-            "expires": self.session.expires
-        }
+        # anonymous sessions get a new anonymous token
+        if self.is_anonymous or self.session.refresh_token:
+            self.refresh_login()
 
     def refresh_login(self):
-        logging.debug(f"Beatport: access_token expired, getting a new one")
-
-        # get a new access_token and refresh_token from the API
-        refresh_data = self.session.refresh()
-        if refresh_data:
-            # Refresh failed (invalid_grant, expired, revoked, account changed, etc.).
-            # Clear stored session and re-login with credentials from settings.
-            # Handles: expired subscriptions, new accounts, password changes.
-            self.module_controller.temporary_settings_controller.set("access_token", None)
-            self.module_controller.temporary_settings_controller.set("refresh_token", None)
-            self.module_controller.temporary_settings_controller.set("expires", None)
-            self.login(self.module_controller.module_settings["username"],
-                       self.module_controller.module_settings["password"])
-            return
+        access_token = self.session.access_token
+        # the same lock BeatportApi refreshes with, a single refresh (or re-login) at a time across all threads
+        with self.session.refresh_lock:
+            logging.debug("Beatport: access_token expired, getting a new one")
+
+            # get a new access_token and refresh_token from the API, saved by the on_refresh callback; nothing to do
+            # if another thread refreshed the session while this one was waiting
+            refresh_data = self.session.refresh_if_stale(access_token)
+            if refresh_data:
+                # Refresh failed (invalid_grant, expired, revoked, account changed, etc.).
+                # Clear stored session and re-login with credentials from settings.
+                # Handles: expired subscriptions, new accounts, password changes.
+                self._clear_session()
+                self.login(self.module_controller.module_settings["username"],
+                           self.module_controller.module_settings["password"])
 
-        self._save_session()
-            
     def login(self, email: str, password: str):
-        logging.debug(f"Beatport: no session found, login")
+        logging.debug("Beatport: no session found, login")
         
         # Check if credentials are provided
         if not email or not password:
@@ -128,9 +395,12 @@ class ModuleInterface:
             )
         
         login_data = self.session.auth(email, password)
+        # new login, possibly a different account
+        self._account_data = None
+        self._clear_subscription_cache()
 
-        if login_data.get("error_description") is not None:
-            error_desc = login_data.get("error_description")
+        error_desc = login_data.get("error_description")
+        if error_desc is not None:
             # Check for blank field errors and provide a better message
             if isinstance(error_desc, dict):
                 if "username" in error_desc and "password" in error_desc:
@@ -150,71 +420,62 @@ class ModuleInterface:
     def valid_account(self):
         if not self.disable_subscription_check:
             # get the subscription from the API and check if it's at least a "Link" subscription
-            account_data = self.session.get_account()
+            # the subscription doesn't change during a run, only fetch it once per login
+            if self._account_data is None:
+                self._account_data = self._load_account_data()
+            account_data = self._account_data
             if not account_data.get("subscription"):
                 raise self.exception("Beatport: Account does not have an active 'Link' subscription")
 
             # Essentials = "bp_basic", Professional = "bp_link_pro" (Monthly/Yearly/Annual)
             sub = account_data.get("subscription", "").lower()
-            if sub == "bp_link_pro" or "pro" in sub:
-                # Pro subscription, set the quality to high and lossless
+            if "pro" in sub and self.quality_parse is not _PRO_QUALITY_PARSE:
+                # Pro subscription, set the quality to high and lossless (only once, valid_account() runs again
+                # after a re-login)
                 self.print("Beatport: Professional subscription detected, allowing high and lossless quality")
-                self.quality_parse[QualityEnum.HIGH] = "high"
-                self.quality_parse[QualityEnum.HIFI] = "lossless"
-                self.quality_parse[QualityEnum.LOSSLESS] = "lossless"
+                self.quality_parse = _PRO_QUALITY_PARSE
+                self.quality_bitrate = _PRO_QUALITY_BITRATE
+
+    def _load_account_data(self) -> dict:
+        # reuse the subscription stored by a previous run for _SUBSCRIPTION_CACHE_TTL seconds, saves the
+        # get_account() request on every start; login(), _clear_session() and every 401 clear it
+        settings = self.module_controller.temporary_settings_controller
+        subscription = settings.read("subscription")
+        checked_at = settings.read("subscription_checked_at")
+        if subscription and checked_at and 0 <= time.time() - checked_at < _SUBSCRIPTION_CACHE_TTL:
+            self._subscription_stored = True
+            return {"subscription": subscription}
+
+        account_data = self.session.get_account()
+        if account_data.get("subscription"):
+            with self.session.refresh_lock:
+                settings.set("subscription", account_data["subscription"])
+                settings.set("subscription_checked_at", time.time())
+                self._subscription_stored = True
+        return account_data
 
     @staticmethod
     def custom_url_parse(link: str):
-        # First, try to match library playlists (e.g., /library/playlists/6099487)
-        # These don't have a slug, just the ID directly after the type
-        library_match = re.search(r"https?://(www\.)?beatport\.com/(?P<region>[a-z]{2}/)?library/(?P<type>playlists)/(?P<id>\d+)", link)
-        
-        if library_match:
-            # Extract region code if present
-            region_code = library_match.group("region")
-            if region_code:
-                region_code = region_code.rstrip("/")
-            
-            extra_kwargs = {"is_chart": False}  # Library playlists are never charts
-            if region_code:
-                extra_kwargs["region"] = region_code
-            
-            return MediaIdentification(
-                media_type=DownloadTypeEnum.playlist,
-                media_id=library_match.group("id"),
-                extra_kwargs=extra_kwargs
-            )
-        
-        # Standard URL pattern with slug (e.g., /track/song-name/123, /release/album-name/456, /label/cenobite-records/33475)
-        match = re.search(r"https?://(www\.)?beatport\.com/(?P<region>[a-z]{2}/)?(?P<type>track|release|artist|playlists|chart|label)/(?P<slug>.+)/(?P<id>\d+)", link)
-
-        # so parse the regex "match" to the actual DownloadTypeEnum
-        media_types = {
-            "track": DownloadTypeEnum.track,
-            "release": DownloadTypeEnum.album,
-            "artist": DownloadTypeEnum.artist,
-            "playlists": DownloadTypeEnum.playlist,
-            "chart": DownloadTypeEnum.playlist,
-            "label": DownloadTypeEnum.label
-        }
-
-        if not match: # Added error handling for robustness
+        # library playlists (e.g., /library/playlists/6099487) and standard URLs with slug
+        # (e.g., /track/song-name/123, /release/album-name/456, /label/cenobite-records/33475)
+        parsed = _parse_url(link)
+
+        if not parsed: # Added error handling for robustness
             raise ValueError(f"Could not parse Beatport URL: {link}")
 
-        # Extract region code if present (e.g., "es" from "/es/")
-        region_code = match.group("region")
-        if region_code:
-            region_code = region_code.rstrip("/")  # Remove trailing slash
+        # region code if present (e.g., "es" from "/es/")
+        region_code, media_type, media_id = parsed
 
-        extra_kwargs = {"is_chart": match.group("type") == "chart"}
-        if match.group("type") == "label":
+        # library playlists are "playlists" as well, so they are never charts
+        extra_kwargs = {"is_chart": media_type == "chart"}
+        if media_type == "label":
             extra_kwargs = {}
         if region_code:
             extra_kwargs["region"] = region_code
 
         return MediaIdentification(
-            media_type=media_types[match.group("type")],
-            media_id=match.group("id"),
+            media_type=_MEDIA_TYPES[media_type],
+            media_id=media_id,
             # check if the playlist is a user playlist or DJ charts, only needed for get_playlist_info()
             extra_kwargs=extra_kwargs
         )
@@ -225,34 +486,12 @@ class ModuleInterface:
         if not cover_url or not isinstance(cover_url, str):
             return None
 
-        # if more than max_size are requested, cap the size at max_size
-        if size > max_size:
-            size = max_size
-
-        # check if it"s a dynamic_uri, if not make it one
-        res_pattern = re.compile(r"\d{3,4}x\d{3,4}")
-        match = re.search(res_pattern, cover_url)
-        if match:
-            # replace the hardcoded resolution with dynamic one
-            cover_url = re.sub(res_pattern, "{w}x{h}", cover_url)
-
-        # replace the dynamic_uri h and w parameter with the wanted size
-        try:
-            return cover_url.format(w=size, h=size)
-        except (KeyError, ValueError):
-            return cover_url
+        return _artwork_url(cover_url, size, max_size)
 
     def search(self, query_type: DownloadTypeEnum, query: str, track_info: TrackInfo = None, limit: int = 20):
-        # map query types to API search types
-        search_types = {
-            DownloadTypeEnum.track: "tracks",
-            DownloadTypeEnum.album: "releases",
-            DownloadTypeEnum.playlist: "charts",
-            DownloadTypeEnum.artist: "artists",
-            DownloadTypeEnum.label: "labels"
-        }
+        self._ensure_fresh_token()
 
-        search_type = search_types.get(query_type)
+        search_type = _SEARCH_TYPES.get(query_type)
 
         # Anonymous tokens 401 on categorized searches with 'type'
         if not self.session.refresh_token:
@@ -271,132 +510,66 @@ class ModuleInterface:
         else:
             # fall back to general search for unsupported types
             results = self.session.get_search(query)
-            name_parse = {
-                "track": "tracks",
-                "album": "releases",
-                "playlist": "charts", # Compatibility: result_list will additionally include 'playlists' below
-                "artist": "artists",
-                "label": "labels"
-            }
-            result_list = results.get(name_parse.get(query_type.name), [])
+            result_list = results.get(_NAME_PARSE.get(query_type.name), [])
             if query_type is DownloadTypeEnum.playlist:
                 result_list += results.get("playlists", [])
         
+        # everything that only depends on query_type is resolved once, not per result
+        project = _SEARCH_PROJECTORS.get(query_type)
+        is_track_search = query_type is DownloadTypeEnum.track
+        is_playlist_search = query_type is DownloadTypeEnum.playlist
+        # Fallback to preferred Beatport cover if no image available (for artists and labels)
+        fallback_image_url = _BEATPORT_PREFERRED_PLACEHOLDER \
+            if query_type in (DownloadTypeEnum.artist, DownloadTypeEnum.label) else None
         items = []
         for i in result_list:
             # Initialize fields for SearchResult
             name = i.get('name', '')
-            artists = []
-            year = None
-            duration = None
-            additional = []
             item_extra_kwargs = {}
+
+            # bind the fields used more than once
+            publish_date = i.get("publish_date")
+            track_count = i.get("track_count")
+            genres_data = i.get("genres")
             
             # Identify if it's a chart or a user playlist
             is_chart = 'publish_date' in i or 'person' in i or 'genres' in i
             item_extra_kwargs['is_chart'] = is_chart
 
             # Safe handling of image data - handle None values properly
-            if query_type is DownloadTypeEnum.track:
-                release_data = i.get('release') or {}
-                image_data = release_data.get('image') or {}
+            if is_track_search:
+                image_data = (i.get('release') or _EMPTY).get('image') or _EMPTY
             else:
-                image_data = i.get('image') or {}
+                image_data = i.get('image') or _EMPTY
             image_uri = image_data.get('uri') or image_data.get('dynamic_uri') if isinstance(image_data, dict) else None
             
-            # Beatport's default placeholder for artists - we want to replace this with a better one
-            beatport_default_placeholder = "0dc61986-bccf-49d4-8fad-6b147ea8f327"
-            beatport_preferred_placeholder = "https://geo-media.beatport.com/image_size/500x500/ab2d1d04-233d-4b08-8234-9782b34dcab8.jpg"
-            
             # Check if the image is the default placeholder
-            if image_uri and beatport_default_placeholder in image_uri:
-                image_url = beatport_preferred_placeholder
+            if image_uri and _BEATPORT_DEFAULT_PLACEHOLDER in image_uri:
+                image_url = _BEATPORT_PREFERRED_PLACEHOLDER
             elif image_uri:
                 image_url = self._generate_artwork_url(image_uri, 56)
             else:
                 image_url = None
-            
-            # Fallback to preferred Beatport cover if no image available (for artists and labels)
-            if not image_url and query_type in (DownloadTypeEnum.artist, DownloadTypeEnum.label):
-                image_url = beatport_preferred_placeholder
+            if not image_url:
+                image_url = fallback_image_url
             
             # Extract preview/sample URL (Beatport provides 2-minute previews)
-            preview_url = i.get('sample_url') or i.get('preview_url') or i.get('sample', {}).get('url')
+            preview_url = i.get('sample_url') or i.get('preview_url') or (i.get('sample') or _EMPTY).get('url')
             
             result_id = str(i.get('id'))
             is_explicit = i.get('explicit', False)
 
-            if query_type is DownloadTypeEnum.playlist:
-                # Artist parsing
-                if i.get('artist') and i['artist'].get('name'):
-                    artists = [i['artist']['name']]
-                elif i.get('person') and i['person'].get('owner_name'):
-                    artists = [i['person']['owner_name']]
-                else:
-                    artists = ["Beatport"]
-                # Year parsing
-                if i.get("publish_date"):
-                    year = i.get("publish_date")[:4]
-                elif i.get("created_date"):
-                    year = i.get("created_date")[:4]
-                # Track count
-                if i.get("track_count") is not None:
-                    tc = i.get('track_count')
-                    additional.append(f"1 track" if tc == 1 else f"{tc} tracks")
-
-            elif query_type is DownloadTypeEnum.track:
-                artists = [a.get("name") for a in i.get("artists", [])]
-                if i.get("publish_date"):
-                    year = i.get("publish_date")[:4]
-                if i.get("length_ms"):
-                    duration = i.get("length_ms") // 1000
-                if i.get("bpm"):
-                    additional.append(f"{i.get('bpm')} BPM")
-                if i.get("mix_name") and name: # Add mix name to track name
-                    name += f" ({i.get('mix_name')})"
-
-            elif query_type is DownloadTypeEnum.album:
-                artists = [a.get("name") for a in i.get("artists", [])]
-                if i.get("publish_date"):
-                    year = i.get("publish_date")[:4]
-                if i.get("track_count") is not None:
-                    tc = i.get('track_count'); additional.append(f"1 track" if tc == 1 else f"{tc} tracks")
-                if i.get("catalog_number"):
-                    additional.append(f"Cat: {i.get('catalog_number')}")
-            
-            elif query_type is DownloadTypeEnum.artist:
-                if i.get("name"):
-                    artists = [i.get("name")]
-                if i.get("genres"):
-                    genre_names = [g.get("name") for g in i.get("genres", []) if g.get("name")]
-                    if genre_names:
-                        additional.append(", ".join(genre_names))
-
-            elif query_type is DownloadTypeEnum.label:
-                rc = i.get("releases_count") or i.get("release_count")
-                if rc is not None and rc == 0:
-                    continue
-                if i.get("name"):
-                    artists = [i.get("name")]
-                date_val = i.get("founded") or i.get("created_at") or i.get("founded_date")
-                if date_val and isinstance(date_val, str) and len(date_val) >= 4:
-                    year = date_val[:4]
-                elif date_val and hasattr(date_val, 'year'):
-                    year = str(getattr(date_val, 'year', ''))
-                if i.get("genres"):
-                    genre_names = [g.get("name") for g in i.get("genres", []) if g.get("name")]
-                    if genre_names:
-                        additional.append(", ".join(genre_names))
-                if rc is not None:
-                    additional.append(f"1 release" if rc == 1 else f"{rc} releases")
+            # type specific fields, None means the result should be skipped
+            projected = project(i, name, publish_date, track_count, genres_data) if project else (name, [], None, None, [])
+            if projected is None:
+                continue
+            name, artists, year, duration, additional = projected
 
             if i.get("exclusive") is True:
                  additional.append("Exclusive")
 
-            if query_type is DownloadTypeEnum.playlist and not is_chart and i.get('track_count') is None:
-                # User playlists from search don't have track_count, we'll fetch it in batch
-                pass
-            elif query_type is DownloadTypeEnum.playlist and (i.get("track_count") is not None and i.get("track_count") == 0):
+            # User playlists from search don't have track_count (None), we'll fetch it in batch
+            if is_playlist_search and track_count == 0:
                 continue
 
             item = SearchResult(
@@ -418,7 +591,6 @@ class ModuleInterface:
             playlists_to_fetch = [t for t in items if not t.extra_kwargs.get('is_chart')]
             charts_to_fetch = [t for t in items if t.extra_kwargs.get('is_chart') and not t.duration]
             
-            import concurrent.futures
             with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
                 # 1. Fetch full metadata for user playlists
                 if playlists_to_fetch:
@@ -434,7 +606,7 @@ class ModuleInterface:
                                 if t.result_id == pid:
                                     # Update fields
                                     if data.get('track_count') is not None:
-                                        t.additional = [f"1 track" if data['track_count'] == 1 else f"{data['track_count']} tracks"]
+                                        t.additional = ["1 track" if data['track_count'] == 1 else f"{data['track_count']} tracks"]
                                     if data.get('length_ms'):
                                         t.duration = data['length_ms'] // 1000
                                     
@@ -448,7 +620,7 @@ class ModuleInterface:
                 if charts_to_fetch:
                     def _fetch_chart_duration(pid):
                         try:
-                            tracks_data = self.session.get_chart_tracks(pid, page=1, per_page=100)
+                            tracks_data = self.session.get_chart_tracks(pid, page=1, per_page=_PAGE_SIZE)
                             if tracks_data and 'results' in tracks_data:
                                 sum_dur = sum((t.get('length_ms') or 0) for t in tracks_data['results'])
                                 return pid, sum_dur // 1000 if sum_dur > 0 else None
@@ -463,7 +635,6 @@ class ModuleInterface:
         # Batch fetch durations for albums
         albums_to_fetch = [t for t in items if query_type == DownloadTypeEnum.album and not t.duration]
         if albums_to_fetch:
-            import concurrent.futures
             with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
                 def _fetch_album_duration(aid):
                     try:
@@ -492,26 +663,90 @@ class ModuleInterface:
 
         return items
         
+    def _fetch_all_pages(self, page_getter, item_id: str, description: str, skip_failed: bool = False) -> list:
+        # all results of a paginated listing, the remaining pages are fetched concurrently
+        # only the first page if a later page fails, nothing if the listing itself fails (API or network errors,
+        # authentication failures raise)
+        try:
+            first_page = page_getter(item_id, per_page=_PAGE_SIZE)
+        except (BeatportError, OSError):
+            return []
+        if not first_page:
+            return []
+
+        total_items = first_page.get("count") or 0
+        if total_items > _PAGE_SIZE:
+            # e.g. "Fetching label releases (250 releases)..."
+            self.print(f"Fetching {description} ({total_items} {description.rsplit(' ', 1)[-1]})...")
+        try:
+            return self.session.get_all_pages(page_getter, item_id, per_page=_PAGE_SIZE,
+                                              first_page=first_page, skip_failed=skip_failed)["results"]
+        except (BeatportError, OSError):
+            return list(first_page.get("results") or ())
+
+    def _prefetch_tracks(self, track_ids: list, tracks_data: dict):
+        # fetch the track records get_track_info() would otherwise request one by one (ids without a complete
+        # record in tracks_data) concurrently and add them to tracks_data
+        missing_ids = [tid for tid in dict.fromkeys(track_ids) if tid not in tracks_data]
+        if not missing_ids:
+            return
+
+        # up to 100 tracks per request, only the ones the bulk request didn't return are fetched one by one
+        tracks_data.update(self.session.get_tracks_bulk(missing_ids))
+        missing_ids = [tid for tid in missing_ids if tid not in tracks_data]
+        if not missing_ids:
+            return
+
+        def _fetch_track(tid):
+            try:
+                return tid, self.session.get_track(tid)
+            except (BeatportError, OSError):
+                # get_track_info() fetches it again and reports the error for this track
+                return tid, None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            for tid, track in executor.map(_fetch_track, missing_ids):
+                if track:
+                    tracks_data[tid] = track
+
+    def _prefetch_releases(self, tracks_data: dict, release_data: dict):
+        # fetch the releases get_track_info() would otherwise request one by one (tracks without an embedded
+        # release name) concurrently and add them to release_data by str id, which is passed down as its
+        # "release_data"; kept apart from the tracks, track and release ids overlap
+        release_ids = set()
+        for track in tracks_data.values():
+            release = track.get('release') or {}
+            if release.get('id') is not None and release.get('name') is None and str(release['id']) not in release_data:
+                release_ids.add(str(release['id']))
+
+        release_data.update(self.session.get_releases_bulk(release_ids))
+
     def get_playlist_info(self, playlist_id: str, is_chart: bool = False, **kwargs) -> PlaylistInfo:
+        self._ensure_fresh_token()
+
         all_tracks_raw = []
         current_page = 1
-        per_page = 100 # Max items per page Beatport API usually allows for tracks
+        per_page = _PAGE_SIZE
 
         playlist_data = None
         tracks_page_data = None
         
         # Helper to fetch based on type
         def fetch_data(use_chart: bool):
-            try:
-                if use_chart:
-                    data = self.session.get_chart(playlist_id)
-                    tracks = self.session.get_chart_tracks(playlist_id, page=current_page, per_page=per_page)
-                else:
-                    data = self.session.get_playlist(playlist_id)
-                    tracks = self.session.get_playlist_tracks(playlist_id, page=current_page, per_page=per_page)
-                return data, tracks
-            except Exception:
-                return None, None
+            # the metadata and the first tracks page are independent, fetch them at the same time
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                try:
+                    if use_chart:
+                        tracks_future = executor.submit(self.session.get_chart_tracks, playlist_id,
+                                                        page=current_page, per_page=per_page)
+                        data = self.session.get_chart(playlist_id)
+                    else:
+                        tracks_future = executor.submit(self.session.get_playlist_tracks, playlist_id,
+                                                        page=current_page, per_page=per_page)
+                        data = self.session.get_playlist(playlist_id)
+                    return data, tracks_future.result()
+                except Exception:
+                    return None, None
 
         # 1. Try determined type
         playlist_data, tracks_page_data = fetch_data(is_chart)
@@ -531,34 +766,35 @@ class ModuleInterface:
                 id=playlist_id
             )
 
-        if tracks_page_data and 'results' in tracks_page_data:
-            all_tracks_raw.extend(tracks_page_data['results'])
-        
         total_items = tracks_page_data.get('count', 0) if tracks_page_data else 0
-        
-        # Paginate if necessary
-        while len(all_tracks_raw) < total_items and total_items > 0:
-            current_page += 1
-            self.print(f"Fetching playlist/chart tracks page {current_page} ({len(all_tracks_raw)}/{total_items})")
-            if is_chart:
-                tracks_page_data = self.session.get_chart_tracks(playlist_id, page=current_page, per_page=per_page)
-            else:
-                tracks_page_data = self.session.get_playlist_tracks(playlist_id, page=current_page, per_page=per_page)
-            
-            if tracks_page_data and 'results' in tracks_page_data and tracks_page_data['results']:
-                all_tracks_raw.extend(tracks_page_data['results'])
-            else:
-                # No more results or error, break loop
-                logging.warning(f"Stopped pagination for {'chart' if is_chart else 'playlist'} {playlist_id} at page {current_page}. Expected {total_items}, got {len(all_tracks_raw)}.")
-                break
-        if total_items > 0: self.print("") # Clear the progress line by printing a newline
 
-        # For playlists (non-charts), tracks are often nested under a 'track' key.
-        # For charts, the track data is usually direct.
-        if not is_chart:
-             processed_tracks_ids = [str(track_item['track']['id']) for track_item in all_tracks_raw if 'track' in track_item and 'id' in track_item['track']]
-        else: # For charts
-             processed_tracks_ids = [str(track_item['id']) for track_item in all_tracks_raw if 'id' in track_item]
+        # Paginate if necessary, all remaining pages are fetched concurrently
+        if tracks_page_data:
+            if len(tracks_page_data.get('results') or []) < total_items:
+                self.print(f"Fetching playlist/chart tracks ({total_items} tracks)")
+            page_getter = self.session.get_chart_tracks if is_chart else self.session.get_playlist_tracks
+            all_tracks_raw = self.session.get_all_pages(page_getter, playlist_id, per_page=per_page,
+                                                        first_page=tracks_page_data, skip_failed=True)['results']
+        if len(all_tracks_raw) < total_items:
+            logging.warning(f"Stopped pagination for {'chart' if is_chart else 'playlist'} {playlist_id}. Expected {total_items}, got {len(all_tracks_raw)}.")
+
+        # a single pass for the track ids and the already fetched track records, passed down to get_track_info
+        processed_tracks_ids = []
+        tracks_data = {}
+        for track_item in all_tracks_raw:
+            # For playlists (non-charts), tracks are often nested under a 'track' key.
+            # For charts, the track data is usually direct.
+            track = track_item if is_chart else track_item.get('track')
+            if not track or (tid := track.get('id')) is None:
+                continue
+            tid = str(tid)
+            processed_tracks_ids.append(tid)
+            # only complete track records, get_track_info() fetches the others itself
+            if 'is_available_for_streaming' in track:
+                tracks_data[tid] = track
+        self._prefetch_tracks(processed_tracks_ids, tracks_data)
+        release_data = {}
+        self._prefetch_releases(tracks_data, release_data)
 
 
         # Common fields for both charts and playlists
@@ -600,16 +836,12 @@ class ModuleInterface:
             num_tracks_from_api = playlist_data.get('track_count') or playlist_data.get('tracks_count', len(processed_tracks_ids))
             is_explicit = False # Playlists might not have a global explicit flag like albums/tracks.
 
-        release_year = None
-        if release_date_str:
-            try:
-                # Handle ISO format dates (e.g., "2023-04-01T15:00:00Z")
-                release_year = datetime.fromisoformat(release_date_str.replace('Z', '+00:00')).year
-            except ValueError:
-                try: # Fallback for simpler date strings like "YYYY-MM-DD"
-                    release_year = datetime.strptime(release_date_str.split('T')[0], '%Y-%m-%d').year
-                except ValueError:
-                    logging.warning(f"Could not parse release date for {'chart' if is_chart else 'playlist'} {playlist_id}: {release_date_str}")
+        # ISO format dates (e.g., "2023-04-01T15:00:00Z" or "2023-04-01"), only the year is needed
+        release_year = _year(release_date_str)
+        if release_year:
+            release_year = int(release_year)
+        elif release_date_str:
+            logging.warning(f"Could not parse release date for {'chart' if is_chart else 'playlist'} {playlist_id}: {release_date_str}")
 
         # Safe handling of image data - handle None values properly
         cover_uri = None
@@ -640,27 +872,18 @@ class ModuleInterface:
             cover_type=cover_type,
             tracks=processed_tracks_ids,
             explicit=is_explicit,
-            track_extra_kwargs={'is_chart': is_chart} # Pass is_chart down for track processing
+            # Pass is_chart down for track processing
+            track_extra_kwargs={'is_chart': is_chart, 'data': tracks_data, 'release_data': release_data}
         )
 
     def get_artist_info(self, artist_id: str, get_credited_albums: bool, is_chart: bool = False, **kwargs) -> ArtistInfo:
+        self._ensure_fresh_token()
+
         artist_data = self.session.get_artist(artist_id)
         artist_name = artist_data.get("name") or "Unknown Artist"
 
         # Fetch artist tracks (paginated)
-        artist_tracks = []
-        try:
-            tracks_data = self.session.get_artist_tracks(artist_id)
-            if tracks_data:
-                artist_tracks = list(tracks_data.get("results") or [])
-                total_tracks = tracks_data.get("count") or len(artist_tracks)
-                num_pages = max(1, (total_tracks + 99) // 100)
-                for page in range(2, num_pages + 1):
-                    self.print(f"Fetching artist tracks (page {page}/{num_pages})...")
-                    paged_res = self.session.get_artist_tracks(artist_id, page=page)
-                    artist_tracks += (paged_res.get("results") if paged_res else []) or []
-        except Exception:
-            pass
+        artist_tracks = self._fetch_all_pages(self.session.get_artist_tracks, artist_id, "artist tracks")
 
         # Build a map of release durations and track counts from fetched tracks to optimize duration fetching
         release_durations_map = {}
@@ -680,19 +903,7 @@ class ModuleInterface:
                         pass
 
         # Fetch artist releases (paginated)
-        releases_list = []
-        try:
-            releases_data = self.session.get_artist_releases(artist_id)
-            if releases_data:
-                releases_list = list(releases_data.get("results") or [])
-                total_releases = releases_data.get("count") or len(releases_list)
-                num_pages = max(1, (total_releases + 99) // 100)
-                for page in range(2, num_pages + 1):
-                    self.print(f"Fetching artist releases (page {page}/{num_pages})...")
-                    paged_res = self.session.get_artist_releases(artist_id, page=page, per_page=100)
-                    releases_list += (paged_res.get("results") if paged_res else []) or []
-        except Exception:
-            pass
+        releases_list = self._fetch_all_pages(self.session.get_artist_releases, artist_id, "artist releases")
 
         # Process releases into album dicts for GUI
         albums_out = []
@@ -710,9 +921,9 @@ class ModuleInterface:
                 'id': rid,
                 'name': r.get("name"),
                 'artist': artist_name,
-                'release_year': str(r.get("new_release_date") or r.get("publish_date") or r.get("release_date") or "")[:4] or None,
+                'release_year': _year(r.get("new_release_date") or r.get("publish_date") or r.get("release_date")),
                 'cover_url': r.get("image", {}).get("uri"),
-                'additional': [f"1 track" if tc == 1 else f"{tc} tracks"] if tc else None,
+                'additional': ["1 track" if tc == 1 else f"{tc} tracks"] if tc else None,
                 'duration': duration,
                 'track_count': tc
             })
@@ -720,7 +931,6 @@ class ModuleInterface:
         # Batch fetch missing durations for albums
         missing_durations = [idx for idx, a in enumerate(albums_out) if a.get('duration') is None]
         if missing_durations:
-            import concurrent.futures
             def _fetch_bp_album_duration(aid):
                 try:
                     # We need to fetch release tracks to sum durations
@@ -743,84 +953,79 @@ class ModuleInterface:
                                 albums_out[idx]['duration'] = dur
                                 break
 
+        # pass the full releases down by str id next to the tracks, get_track_info() prefers them over the
+        # embedded release, and fetch the few ones still missing in bulk instead of once per track
+        track_data_map = {t.get("id"): t for t in artist_tracks}
+        release_data_map = {str(rid): r for r in releases_list if (rid := r.get("id")) is not None}
+        self._prefetch_releases(track_data_map, release_data_map)
+
         return ArtistInfo(
             name=artist_name,
             artist_id=artist_id,
             albums=albums_out,
             tracks=[t.get("id") for t in artist_tracks],
-            track_extra_kwargs={"data": {t.get("id"): t for t in artist_tracks}},
+            track_extra_kwargs={"data": track_data_map, "release_data": release_data_map},
         )
 
     def get_label_info(self, label_id: str, get_credited_albums: bool = True, **kwargs) -> ArtistInfo:
         """Return label metadata, releases (as albums), and tracks as ArtistInfo for consistent download flow."""
-        label_data = self.session.get_label(label_id)
+        self._ensure_fresh_token()
+
+        # Fetch all label tracks and releases (paginated); API may not support the tracks endpoint
+        # both listings and the label itself are independent, fetch them at the same time
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            tracks_future = executor.submit(self._fetch_all_pages, self.session.get_label_tracks, label_id,
+                                            "label tracks", skip_failed=True)
+            releases_future = executor.submit(self._fetch_all_pages, self.session.get_label_releases, label_id,
+                                              "label releases", skip_failed=True)
+            label_data = self.session.get_label(label_id)
+            label_tracks = tracks_future.result()
+            releases_list = releases_future.result()
         label_name = label_data.get("name") or "Unknown Label"
 
-        # Fetch all label tracks (paginated); API may not support this endpoint
-        label_tracks = []
-        try:
-            tracks_data = self.session.get_label_tracks(label_id)
-            label_tracks = list(tracks_data.get("results") or [])
-            total_tracks = tracks_data.get("count") or len(label_tracks)
-            num_pages = max(1, (total_tracks + 99) // 100)
-            for page in range(2, num_pages + 1):
-                self.print(f"Fetching label tracks (page {page}/{num_pages})...")
-                label_tracks += self.session.get_label_tracks(label_id, page=page, per_page=100).get("results") or []
-            if num_pages > 1:
-                self.print("")
-        except Exception:
-            pass
-
-        # Fetch all label releases (paginated)
-        releases_list = []
-        try:
-            releases_data = self.session.get_label_releases(label_id)
-            releases_list = list(releases_data.get("results") or [])
-            total_releases = releases_data.get("count") or len(releases_list)
-            num_pages = max(1, (total_releases + 99) // 100)
-            for page in range(2, num_pages + 1):
-                self.print(f"Fetching label releases (page {page}/{num_pages})...")
-                releases_list += self.session.get_label_releases(label_id, page=page, per_page=100).get("results") or []
-            if num_pages > 1:
-                self.print("")
-        except Exception:
-            pass
-
-        release_ids = [str(r.get("id")) for r in releases_list if r.get("id") is not None]
-        track_ids = [t.get("id") for t in label_tracks if t.get("id") is not None]
+        # the releases and tracks passed down to get_album_info()/get_track_info(), by id in a single pass each
+        album_data_map = {str(rid): r for r in releases_list if (rid := r.get("id")) is not None}
+        track_ids = []
+        track_data_map = {}
+        for t in label_tracks:
+            tid = t.get("id")
+            if tid is not None:
+                track_ids.append(tid)
+                track_data_map[tid] = t
+        # the full releases for get_track_info() as in get_artist_info(), the missing ones fetched in bulk (a copy,
+        # album_data_map only holds the label's own releases)
+        release_data_map = dict(album_data_map)
+        self._prefetch_releases(track_data_map, release_data_map)
 
         # Batch fetch missing durations for albums (cap to 100 to prevent API rate limits/hanging)
-        missing_durations = [idx for idx, r in enumerate(releases_list) if r.get('duration') is None and r.get('length_ms') is None]
+        missing_durations = [rid for rid, r in album_data_map.items() if r.get('duration') is None and r.get('length_ms') is None]
         missing_durations = missing_durations[:100]
         if missing_durations:
-            import concurrent.futures
             def _fetch_bp_album_duration(aid):
                 try:
                     r_tracks = self.session.get_release_tracks(aid).get("results") or []
-                    total_sec = sum(int(float(t.get("length_ms", 0)) / 1000) for t in r_tracks)
+                    total_sec = sum(int(float(t.get("length_ms", 0) or 0) / 1000) for t in r_tracks if t)
                     return aid, total_sec or None
                 except: return aid, None
 
             with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                fetch_ids = [str(releases_list[idx]['id']) for idx in missing_durations]
-                future_to_idx = {executor.submit(_fetch_bp_album_duration, fetch_ids[i]): missing_durations[i] for i in range(len(fetch_ids))}
+                futures = [executor.submit(_fetch_bp_album_duration, rid) for rid in missing_durations]
                 completed = 0
-                total = len(future_to_idx)
-                for future in concurrent.futures.as_completed(future_to_idx):
+                total = len(futures)
+                last_progress = 0.0
+                for future in concurrent.futures.as_completed(futures):
                     completed += 1
-                    if completed % 10 == 0 or completed == total:
+                    # throttled like the pagination progress, completions arrive in bursts
+                    if time.monotonic() - last_progress >= _PROGRESS_INTERVAL or completed == total:
                         self.print(f"Fetching release durations (page {completed}/{total})...")
+                        last_progress = time.monotonic()
                     try:
                         aid, dur = future.result()
                         if dur:
-                            idx = future_to_idx[future]
-                            releases_list[idx]['duration'] = dur
+                            album_data_map[aid]['duration'] = dur
                     except Exception:
                         pass
 
-        album_data_map = {str(r.get("id")): r for r in releases_list if r.get("id") is not None}
-        track_data_map = {t.get("id"): t for t in label_tracks if t.get("id") is not None}
-        
         # Prepare albums as list of dicts for GUI consistency
         albums_out = []
         for rid, r in album_data_map.items():
@@ -832,9 +1037,9 @@ class ModuleInterface:
                 'artists': r.get("artists"),
                 'image': r.get("image"),
                 'publish_date': r.get("publish_date") or r.get("release_date") or r.get("new_release_date"),
-                'release_year': str(r.get("publish_date") or r.get("release_date") or r.get("new_release_date") or "")[:4] or None,
+                'release_year': _year(r.get("publish_date") or r.get("release_date") or r.get("new_release_date")),
                 'cover_url': (r.get("image") or {}).get("uri"),
-                'additional': [f"1 track" if tc == 1 else f"{tc} tracks"] if tc else None,
+                'additional': ["1 track" if tc == 1 else f"{tc} tracks"] if tc else None,
                 'duration': r.get("duration"),
                 'track_count': tc,
                 'catalog_number': r.get("catalog_number")
@@ -846,88 +1051,121 @@ class ModuleInterface:
             albums=albums_out,
             album_extra_kwargs={"data": album_data_map},
             tracks=track_ids,
-            track_extra_kwargs={"data": track_data_map},
+            track_extra_kwargs={"data": track_data_map, "release_data": release_data_map},
         )
 
     def get_album_info(self, album_id: str, data=None, is_chart: bool = False, **kwargs) -> Optional[AlbumInfo]:
+        self._ensure_fresh_token()
+
         # check if album is already in album cache, add it
         if data is None:
             data = {}
 
+        # the release and the first page of its tracks are independent, fetch the tracks in the background
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        tracks_future = executor.submit(self.session.get_release_tracks, album_id, per_page=_PAGE_SIZE)
+        # no more submits, don't wait for the tracks on an early return
+        executor.shutdown(wait=False)
+
         try:
-            album_data = data.get(album_id) if album_id in data else self.session.get_release(album_id)
+            album_data = data.get(album_id)
+            if album_data is None:
+                album_data = self.session.get_release(album_id)
         except Exception as e:
             error_message = str(e)
-            import logging
             logging.warning(f"Beatport: Error getting album {album_id}: {error_message}")
-            if data and album_id in data:
-                album_data = data[album_id]
-            else:
-                # Return minimal Info if we can't even get metadata
-                return AlbumInfo(
-                    name="Unknown Album",
-                    release_year=None,
-                    tracks=[],
-                    artist="Unknown Artist",
-                    id=album_id
-                )
+            # Return minimal Info if we can't even get metadata
+            return AlbumInfo(
+                name="Unknown Album",
+                release_year=None,
+                tracks=[],
+                artist="Unknown Artist",
+                id=album_id
+            )
+
+        # bind the fields used more than once
+        publish_date = album_data.get("publish_date")
+        album_artists = album_data.get("artists")
+        main_artist = album_artists[0] if album_artists else None
+        album_image = album_data.get("image")
+        cover_url = self._generate_artwork_url(
+            (album_image or _EMPTY).get("dynamic_uri"), self.cover_size) if album_image else None
 
         try:
-            tracks_data = self.session.get_release_tracks(album_id)
+            tracks_data = tracks_future.result()
         except Exception as e:
             error_message = str(e)
-            logging.warning(f"Beatport: Error getting album tracks for {album_id}: {error_message}")
-            self.print(f"Beatport: Could not get tracks for album {album_id} - {error_message}")
+            if ("album", album_id) not in self._warned_ids:
+                self._warned_ids.add(("album", album_id))
+                logging.info(f"Beatport: Error getting album tracks for {album_id}: {error_message}")
+                self.print(f"Beatport: Could not get tracks for album {album_id} - {error_message}")
             
             # Return album info without tracks if we can't get track list
             return AlbumInfo(
                 name=album_data.get("name", "Unknown Album"),
-                release_year=album_data.get("publish_date")[:4] if album_data.get("publish_date") else None,
+                release_year=_year(publish_date),
                 duration=0,
                 upc=album_data.get("upc"),
-                cover_url=self._generate_artwork_url(
-                    (album_data.get("image") or {}).get("dynamic_uri"), self.cover_size) if album_data.get("image") else None,
-                artist=album_data.get("artists")[0].get("name") if album_data.get("artists") else "Unknown Artist",
-                artist_id=str(album_data.get("artists")[0].get("id")) if album_data.get("artists") else "",
+                cover_url=cover_url,
+                artist=main_artist.get("name") if main_artist else "Unknown Artist",
+                artist_id=str(main_artist.get("id")) if main_artist else "",
                 tracks=[],
                 track_extra_kwargs={},
             )
 
-        # now fetch all the found total_items
-        tracks = tracks_data.get("results")
+        # now fetch all the found total_items, the remaining pages concurrently
         total_tracks = tracks_data.get("count")
-        num_pages = max(1, (total_tracks + 99) // 100)
-        for page in range(2, num_pages + 1):
-            print(f"Fetching {len(tracks)}/{total_tracks}", end="\r")
-            tracks += self.session.get_release_tracks(album_id, page=page).get("results")
-
-        cache = {"data": {album_id: album_data}}
-        for i, track in enumerate(tracks):
+        tracks = self.session.get_all_pages(self.session.get_release_tracks, album_id, per_page=_PAGE_SIZE,
+                                            first_page=tracks_data)["results"]
+
+        # a single pass over the tracks for the track numbers, the cache, the ids and the total duration
+        data_map = {}
+        track_ids = []
+        duration = 0
+        # every track carries its own copy of the same release and artist dicts, keep one object per id instead
+        releases_by_id = {}
+        artists_by_id = {}
+        for i, track in enumerate(tracks, 1):
             # add the track numbers
-            track["number"] = i + 1
+            track["number"] = i
+            release = track.get("release")
+            if release and (release_id := release.get("id")) is not None:
+                track["release"] = releases_by_id.setdefault(release_id, release)
+            track_artists = track.get("artists")
+            if track_artists:
+                track["artists"] = [artists_by_id.setdefault(artist_id, a)
+                                    if isinstance(a, dict) and (artist_id := a.get("id")) is not None else a
+                                    for a in track_artists]
+            track_id = track.get("id")
             # add the modified track to the track_extra_kwargs
-            cache["data"][track.get("id")] = track
+            data_map[track_id] = track
+            track_ids.append(track_id)
+            # sum up all the individual track lengths
+            length_ms = track.get("length_ms")
+            if length_ms:
+                duration += length_ms // 1000
+        cache = {"data": data_map, "release_data": {str(album_id): album_data}}
 
         return AlbumInfo(
             name=album_data.get("name"),
-            release_year=album_data.get("publish_date")[:4] if album_data.get("publish_date") else None,
-            # sum up all the individual track lengths
-            duration=sum([(t.get("length_ms") or 0) // 1000 for t in tracks]),
+            release_year=_year(publish_date),
+            duration=duration,
             upc=album_data.get("upc"),
-            cover_url=self._generate_artwork_url(
-                (album_data.get("image") or {}).get("dynamic_uri"), self.cover_size) if album_data.get("image") else None,
-            artist=(album_data.get("artists")[0].get("name") if album_data.get("artists") else "Unknown Artist"),
-            artist_id=(str(album_data.get("artists")[0].get("id")) if album_data.get("artists") else None),
-            album_artist=(album_data.get("artists")[0].get("name") if album_data.get("artists") else "Unknown Artist"),
-            label=(album_data.get("label") or {}).get("name"),
+            cover_url=cover_url,
+            artist=(main_artist.get("name") if main_artist else "Unknown Artist"),
+            artist_id=(str(main_artist.get("id")) if main_artist else None),
+            album_artist=(main_artist.get("name") if main_artist else "Unknown Artist"),
+            label=(album_data.get("label") or _EMPTY).get("name"),
             catalog_number=album_data.get("catalog_number"),
-            tracks=[t.get("id") for t in tracks],
+            tracks=track_ids,
             expected_track_count=int(total_tracks) if total_tracks is not None else None,
             track_extra_kwargs=cache,
         )
 
     def get_track_info(self, track_id: str, quality_tier: QualityEnum, codec_options: CodecOptions, slug: str = None,
-                       data=None, is_chart: bool = False, **kwargs) -> TrackInfo:
+                       data=None, release_data=None, is_chart: bool = False, **kwargs) -> TrackInfo:
+        self._ensure_fresh_token()
+
         error = None
         if self.is_anonymous:
             error = "Beatport credentials are required for downloading. Please fill in your username and password in settings."
@@ -943,29 +1181,26 @@ class ModuleInterface:
         except BeatportError as e:
             # Handle Beatport-specific errors gracefully
             error_message = str(e)
-            import logging
             logging.warning(f"Beatport: Error getting track {track_id}: {error_message}")
             
+            found = {phrase.lower() for phrase in _TRACK_ERROR_RE.findall(error_message)}
+            error_template = next((template for phrase, template in _TRACK_ERRORS.items() if phrase in found), None)
+
             # Check if it's a "not found" error - this might mean the track ID doesn't match the API
-            if "not found" in error_message.lower() or "no track matches" in error_message.lower():
+            if error_template is _TRACK_NOT_FOUND_ERROR:
                 # Track not found - this could mean:
                 # 1. The track ID in the URL doesn't match the API track ID
                 # 2. The track is not available via the API endpoint (but might be on the website)
                 # 3. The API has an issue
-                # Print a helpful message to console
-                self.print(f"Beatport: Track ID {track_id} not found in API.")
-                self.print(f"  This can happen if the track ID in the URL doesn't match the API track ID.")
-                self.print(f"  Solution: Use the release URL instead (e.g., https://www.beatport.com/release/.../RELEASE_ID)")
-                error_message = f"Track not found in API: {error_message}. The track ID from the URL ({track_id}) might not match the API track ID. Try using the release URL instead."
-            elif "region locked" in error_message.lower():
-                error_message = f"Track is not available in your region. Original error: {error_message}"
-            elif "subscription required" in error_message.lower():
-                error_message = "Track requires a higher subscription level"
-            elif "content not available" in error_message.lower():
-                error_message = "Track is not available for download"
-            elif "access denied" in error_message.lower() or "api error" in error_message.lower():
-                # For access denied or API errors, show the full message for debugging
-                error_message = f"API error: {error_message}. This might be a temporary API issue. Try again later or check your subscription status."
+                # Print a helpful message to console, a single write
+                if ("track", track_id) not in self._warned_ids:
+                    self._warned_ids.add(("track", track_id))
+                    self.print(f"Beatport: Track ID {track_id} not found in API.\n"
+                               "  This can happen if the track ID in the URL doesn't match the API track ID.\n"
+                               "  Solution: Use the release URL instead "
+                               "(e.g., https://www.beatport.com/release/.../RELEASE_ID)")
+            if error_template:
+                error_message = error_template.format(error=error_message, track_id=track_id)
             
             # Return a minimal TrackInfo with error instead of crashing
             return TrackInfo(
@@ -987,60 +1222,71 @@ class ModuleInterface:
             )
 
         # Safe access to release.id
-        release_data = track_data.get("release") or {}
-        album_id = release_data.get("id")
+        embedded_release = track_data.get("release") or {}
+        album_id = embedded_release.get("id")
         album_data = {}
         # Only overwrite error if not already set (e.g. from anonymous check)
         if error is None:
             error = None
 
+        # Prefer the full release passed down by get_album_info()/get_playlist_info()/... in release_data (by str
+        # id), it has the upc, track_count and artists the embedded release lacks
+        if album_id is not None and release_data:
+            album_data = release_data.get(str(album_id)) or {}
         # When track_data came from cache (e.g. artist tracks), use embedded release to avoid N get_release calls
-        if release_data and release_data.get("name") is not None and release_data.get("id") is not None:
-            album_data = release_data
+        if not album_data and embedded_release.get("name") is not None and album_id is not None:
+            album_data = embedded_release
         try:
-            if not album_data:
-                album_data = data.get(album_id) or (data.get(int(album_id)) if album_id is not None and str(album_id).isdigit() else None)
             if not album_data:
                 album_data = self.session.get_release(album_id) if album_id else {}
         except ConnectionError as e:
-            # Log the actual error for debugging
-            import logging
-            logging.warning(f"Beatport: ConnectionError getting album {album_id}: {str(e)}")
-            # Only mark as region locked if explicitly stated
             error_str = str(e)
+            # Log the actual error for debugging, once per album instead of once per track
+            if ("album", album_id) not in self._warned_ids:
+                self._warned_ids.add(("album", album_id))
+                logging.warning(f"Beatport: ConnectionError getting album {album_id}: {error_str}")
+            # Only mark as region locked if explicitly stated
             if "Territory Restricted." in error_str or "territory restricted" in error_str.lower():
                 error = f"Album {album_id} is region locked"
             else:
                 # Don't assume region lock - show the actual error
                 error = f"Album {album_id} - {error_str}"
 
-        track_name = track_data.get("name")
-        track_name += f" ({track_data.get('mix_name')})" if track_data.get("mix_name") else ""
+        # bind the fields used more than once
+        mix_name = track_data.get("mix_name")
+        publish_date = track_data.get("publish_date")
+        bpm = track_data.get("bpm")
+        catalog_number = track_data.get("catalog_number")
+        track_artists = track_data.get("artists") or []
+        first_artist = track_artists[0] if track_artists else _EMPTY
+
+        base_name = track_data.get("name")
+        track_name = f"{base_name} ({mix_name})" if mix_name else base_name
 
-        release_year = track_data.get("publish_date")[:4] if track_data.get("publish_date") else None
+        release_year = _year(publish_date)
         # Safe access to genre names
-        genre_data = track_data.get("genre") or {}
-        genres = [genre_data.get("name")] if genre_data.get("name") else []
+        genre_name = (track_data.get("genre") or _EMPTY).get("name")
+        genres = [genre_name] if genre_name else []
         # check if a second genre exists
-        sub_genre_data = track_data.get("sub_genre") or {}
-        if sub_genre_data.get("name"):
-            genres.append(sub_genre_data.get("name"))
+        sub_genre_name = (track_data.get("sub_genre") or _EMPTY).get("name")
+        if sub_genre_name:
+            genres.append(sub_genre_name)
 
         extra_tags = {}
-        if track_data.get("bpm"):
-            extra_tags["BPM"] = str(track_data.get("bpm"))
-        key_data = track_data.get("key") or {}
-        if key_data.get("name"):
-            extra_tags["Key"] = key_data.get("name")
-        if track_data.get("catalog_number"):
-            extra_tags["Catalog number"] = track_data.get("catalog_number")
+        if bpm:
+            extra_tags["BPM"] = str(bpm)
+        key_name = (track_data.get("key") or _EMPTY).get("name")
+        if key_name:
+            extra_tags["Key"] = key_name
+        if catalog_number:
+            extra_tags["Catalog number"] = catalog_number
 
         # Safe access to nested release data
-        label_data = release_data.get("label") or {}
+        label_name = (embedded_release.get("label") or _EMPTY).get("name")
         # Determine the primary album artist name. Use joined artist names.
-        album_artists = album_data.get("artists") or track_data.get("artists")
-        album_artist_names = [a.get("name") for a in (album_artists or []) if isinstance(a, dict) and a.get("name")]
-        album_artist = album_artist_names[0] if album_artist_names else "Unknown Artist"
+        album_artists = album_data.get("artists") or track_artists
+        album_artist = next((artist_name for a in album_artists
+                             if isinstance(a, dict) and (artist_name := a.get("name"))), "Unknown Artist")
 
         tags = Tags(
             album_artist=album_artist,
@@ -1049,72 +1295,69 @@ class ModuleInterface:
             upc=album_data.get("upc"),
             isrc=track_data.get("isrc"),
             genres=genres,
-            release_date=track_data.get("publish_date"),
-            copyright=f"© {release_year} {label_data.get('name')}" if label_data.get('name') else None,
-            label=label_data.get("name"),
-            catalog_number=track_data.get("catalog_number"),
+            release_date=publish_date,
+            copyright=f"© {release_year} {label_name}" if label_name else None,
+            label=label_name,
+            catalog_number=catalog_number,
             track_url=f"https://www.beatport.com/track/{slug if slug else 'track'}/{track_id}",
             extra_tags=extra_tags
         )
 
         if not track_data["is_available_for_streaming"]:
-            error = f"Track '{track_data.get('name')}' is not streamable!"
+            error = f"Track '{base_name}' is not streamable!"
         elif track_data.get("preorder"):
-            error = f"Track '{track_data.get('name')}' is not yet released!"
-
-        quality = self.quality_parse[quality_tier]
-        bitrate = {
-            "lossless": 1411,
-            "high": 256,
-            "medium": 128,
-        }
+            error = f"Track '{base_name}' is not yet released!"
+
+        quality, bitrate = self.quality_bitrate[quality_tier]
+        is_lossless = quality == "lossless"
         length_ms = track_data.get("length_ms")
 
         # Safe access to release image data
-        release_image_data = release_data.get("image") or {}
-        cover_dynamic_uri = release_image_data.get("dynamic_uri")
+        cover_dynamic_uri = (embedded_release.get("image") or _EMPTY).get("dynamic_uri")
 
         # Extract preview/sample URL (same as search; enables album track list preview in GUI)
-        preview_url = track_data.get('sample_url') or track_data.get('preview_url') or (track_data.get('sample') or {}).get('url')
+        preview_url = track_data.get('sample_url') or track_data.get('preview_url') or (track_data.get('sample') or _EMPTY).get('url')
 
         track_info = TrackInfo(
             name=track_name,
             album=album_data.get("name"),
             album_id=album_data.get("id"),
-            artists=[a.get("name") for a in track_data.get("artists")],
-            artist_id=track_data.get("artists")[0].get("id"),
+            artists=[a.get("name") for a in track_artists],
+            artist_id=first_artist.get("id"),
             id=str(track_id),
             release_year=release_year,
             duration=length_ms // 1000 if length_ms else None,
-            bitrate=bitrate[quality],
-            bit_depth=16 if quality == "lossless" else None,  # https://en.wikipedia.org/wiki/Audio_bit_depth#cite_ref-1
+            bitrate=bitrate,
+            bit_depth=16 if is_lossless else None,  # https://en.wikipedia.org/wiki/Audio_bit_depth#cite_ref-1
             sample_rate=44.1,
             cover_url=self._generate_artwork_url(cover_dynamic_uri, self.cover_size) if cover_dynamic_uri else None,
             tags=tags,
-            codec=CodecEnum.FLAC if quality == "lossless" else CodecEnum.AAC,
+            codec=CodecEnum.FLAC if is_lossless else CodecEnum.AAC,
             download_extra_kwargs={"track_id": track_id, "quality_tier": quality_tier},
             error=error,
             preview_url=preview_url,
-            additional=f"{track_data.get('bpm')} BPM" if track_data.get("bpm") else None
+            additional=f"{bpm} BPM" if bpm else None
         )
 
         return track_info
 
-    def get_track_cover(self, track_id: str, cover_options: CoverOptions, data=None) -> CoverInfo:
+    def get_track_cover(self, track_id: str, cover_options: CoverOptions, data=None, **kwargs) -> CoverInfo:
         if data is None:
             data = {}
 
-        track_data = data[track_id] if track_id in data else self.session.get_track(track_id)
+        track_data = data.get(track_id)
+        if track_data is None:
+            track_data = self.session.get_track(track_id)
         # Safe access to release image data
-        release_data = track_data.get("release") or {}
-        release_image_data = release_data.get("image") or {}
-        cover_url = release_image_data.get("dynamic_uri")
+        cover_url = ((track_data.get("release") or _EMPTY).get("image") or _EMPTY).get("dynamic_uri")
 
         return CoverInfo(
             url=self._generate_artwork_url(cover_url, cover_options.resolution) if cover_url else None,
             file_type=ImageFileTypeEnum.jpg)
 
     def get_track_download(self, track_id: str, quality_tier: QualityEnum) -> TrackDownloadInfo:
+        self._ensure_fresh_token()
+
         if not self.module_controller.module_settings.get("username") or not self.module_controller.module_settings.get("password"):
             raise self.exception("Downloading tracks requires a logged-in Beatport account. Please add your credentials in the settings.")
 
@@ -1123,9 +1366,18 @@ class ModuleInterface:
         if not stream_data.get("location"):
             raise self.exception("Could not get stream, exiting")
 
+        if self.validate_download_url:
+            self._validate_download_url(track_id, stream_data.get("location"))
+
+        return TrackDownloadInfo(
+            download_type=DownloadEnum.URL,
+            file_url=stream_data.get("location")
+        )
+
+    def _validate_download_url(self, track_id: str, url: str):
         # Validate the download URL by checking content headers
         try:
-            response = self.session.s.head(stream_data.get("location"), timeout=10)
+            response = self.session.s.head(url, timeout=10)
             content_length = response.headers.get('content-length')
             content_type = response.headers.get('content-type', '')
             
@@ -1134,8 +1386,7 @@ class ModuleInterface:
                 raise self.exception(f"Track '{track_id}' appears to be corrupted (only {content_length} bytes available)")
             
             # Check if content type is appropriate for audio
-            if content_type and not any(audio_type in content_type.lower() 
-                                       for audio_type in ['audio', 'octet-stream', 'mpeg', 'flac', 'application', 'video', 'mp4']):
+            if content_type and not _AUDIO_CONTENT_TYPE_RE.search(content_type):
                 raise self.exception(f"Track '{track_id}' does not contain valid audio content")
                 
         except Exception as e:
@@ -1147,9 +1398,4 @@ class ModuleInterface:
                 raise e
             else:
                 # For other errors, log a warning but allow the download to proceed
-                logging.warning(f"Could not validate download URL for track {track_id}: {e}")
-
-        return TrackDownloadInfo(
-            download_type=DownloadEnum.URL,
-            file_url=stream_data.get("location")
-        )
\ No newline at end of file
+                logging.warning(f"Could not validate download URL for track {track_id}: {e}")
\ No newline at end of file